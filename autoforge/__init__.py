@@ -5,6 +5,33 @@ AutoForge - 基于HuggingFace的全自动化模型优化框架
 __version__ = "0.1.0"
 __author__ = "AutoForge Team"
 
-from .core import AutoForgeAgent
+import logging
+from typing import TYPE_CHECKING
 
-__all__ = ["AutoForgeAgent"] 
\ No newline at end of file
+if TYPE_CHECKING:
+    from .core import AutoForgeAgent
+
+__all__ = ["AutoForgeAgent", "configure_third_party_logging"]
+
+_third_party_logging_configured = False
+
+
+def configure_third_party_logging():
+    """屏蔽httpx、httpcore等三方库的INFO日志，进程内只需配置一次"""
+    global _third_party_logging_configured
+    if _third_party_logging_configured:
+        return
+    
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    _third_party_logging_configured = True
+
+
+def __getattr__(name):
+    """按需导入AutoForgeAgent：只使用爬虫等子模块时不加载LLM客户端、文档解析等重量级依赖"""
+    if name == "AutoForgeAgent":
+        from .core import AutoForgeAgent
+        globals()["AutoForgeAgent"] = AutoForgeAgent
+        return AutoForgeAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+ 
\ No newline at end of file
@@ -5,16 +5,18 @@ GitHub 仓库分析器
 
 import os
 import json
-import time
 import logging
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Tuple
 import tempfile
 from datetime import datetime
 import re
 
+import requests
 from tqdm import tqdm
 
 from .base import BaseAnalyzer
@@ -31,7 +33,8 @@ class GitHubRepoAnalyzer(BaseAnalyzer):
                  keep_repos: bool = False,
                  llm_client=None,
                  output_dir: str = "outputs",
-                 save_intermediate: bool = True):
+                 save_intermediate: bool = True,
+                 max_concurrent_clones: int = 5):
         """
         初始化 GitHub 仓库分析器
         
@@ -42,12 +45,18 @@ class GitHubRepoAnalyzer(BaseAnalyzer):
             llm_client: 大语言模型客户端
             output_dir: 输出目录
             save_intermediate: 是否保存中间结果
+            max_concurrent_clones: 多线程调用时同时进行的最大克隆数
         """
         super().__init__(llm_client=llm_client, output_dir=output_dir, save_intermediate=save_intermediate)
         self.workspace_dir = Path(workspace_dir)
         self.clone_timeout = clone_timeout
         self.keep_repos = keep_repos
         
+        # 并发控制：限制同时克隆的数量，同名仓库的克隆与分析串行进行（共用同一目录）
+        self._clone_semaphore = threading.Semaphore(max_concurrent_clones)
+        self._repo_locks: Dict[str, threading.Lock] = {}
+        self._repo_locks_guard = threading.Lock()
+        
         # 创建工作目录
         self.workspace_dir.mkdir(parents=True, exist_ok=True)
         
@@ -191,57 +200,183 @@ class GitHubRepoAnalyzer(BaseAnalyzer):
         Returns:
             仓库分析信息
         """
-        # 克隆仓库
-        success, repo_path = self.clone_repo(repo_url)
-        
-        if not success:
-            return {
-                "status": "error",
-                "message": f"克隆仓库失败: {repo_url}",
-                "repo_url": repo_url
-            }
+        with self._get_repo_lock(repo_url):
+            # 克隆仓库
+            with self._clone_semaphore:
+                success, repo_path = self.clone_repo(repo_url)
+            
+            if not success:
+                return {
+                    "status": "error",
+                    "message": f"克隆仓库失败: {repo_url}",
+                    "repo_url": repo_url
+                }
+            
+            # 分析仓库
+            analysis_result = self.analyze_repo(repo_path)
         
-        # 分析仓库
-        analysis_result = self.analyze_repo(repo_path)
         analysis_result["repo_url"] = repo_url
         
         return analysis_result
     
-    def batch_analyze_repos(self, repo_urls: List[str]) -> List[Dict[str, Any]]:
+    def _get_repo_lock(self, repo_url: str) -> threading.Lock:
+        """获取仓库对应的锁，同名仓库共用一个工作目录"""
+        repo_name = self._extract_repo_name(repo_url)
+        with self._repo_locks_guard:
+            return self._repo_locks.setdefault(repo_name, threading.Lock())
+    
+    def batch_analyze_repos(self, repo_urls: List[str], max_workers: int = 3) -> List[Dict[str, Any]]:
         """
         批量分析多个仓库
         
+        克隆以网络I/O为主，各仓库相互独立，使用线程池并发处理。
+        
         Args:
             repo_urls: GitHub 仓库URL列表
+            max_workers: 并发线程数
             
         Returns:
-            分析结果列表
+            分析结果列表，顺序与repo_urls一致
         """
         logger.info(f"开始批量分析 {len(repo_urls)} 个仓库")
         
-        results = []
+        if not repo_urls:
+            return []
         
-        for repo_url in tqdm(repo_urls, desc="分析仓库"):
-            try:
-                result = self.analyze_repo_from_url(repo_url)
-                results.append(result)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(repo_urls)
+        
+        with ThreadPoolExecutor(max_workers=min(len(repo_urls), max_workers)) as executor:
+            future_to_index = {
+                executor.submit(self.analyze_repo_from_url, repo_url): index
+                for index, repo_url in enumerate(repo_urls)
+            }
+            
+            for future in tqdm(as_completed(future_to_index), total=len(future_to_index), desc="分析仓库"):
+                index = future_to_index[future]
+                repo_url = repo_urls[index]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.error(f"分析仓库异常: {repo_url} - {e}")
+                    results[index] = {
+                        "status": "error",
+                        "message": str(e),
+                        "repo_url": repo_url
+                    }
                 
                 # 保存阶段性结果
-                self._save_analysis_results(results)
-                
-                # 避免频繁请求
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"分析仓库异常: {repo_url} - {e}")
+                self._save_analysis_results([result for result in results if result is not None])
+        
+        return results
+    
+    def summary_only_batch(self, repo_urls: List[str], token: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        通过 GitHub GraphQL API 批量获取仓库摘要（无需克隆）
+        
+        单次请求为所有仓库获取语言占比、README以及依赖清单文件，
+        返回字段与analyze_repo中的language_stats、dependencies、readme一致。
+        
+        Args:
+            repo_urls: GitHub 仓库URL列表
+            token: GitHub访问令牌，默认从环境变量GITHUB_TOKEN读取
+            
+        Returns:
+            分析结果列表，顺序与repo_urls一致
+        """
+        token = token or os.getenv("GITHUB_TOKEN")
+        if not token:
+            raise ValueError("请提供GitHub访问令牌（通过GITHUB_TOKEN环境变量或token参数）")
+        
+        # 每个仓库一个带别名的子查询
+        repo_fields = """
+            languages(first: 20, orderBy: {field: SIZE, direction: DESC}) {
+                totalSize
+                edges { size node { name } }
+            }
+            readme: object(expression: "HEAD:README.md") { ... on Blob { text } }
+            requirements: object(expression: "HEAD:requirements.txt") { ... on Blob { text } }
+            packageJson: object(expression: "HEAD:package.json") { ... on Blob { text } }
+            root: object(expression: "HEAD:") { ... on Tree { entries { name } } }
+        """
+        declarations = []
+        selections = []
+        variables = {}
+        for index, repo_url in enumerate(repo_urls):
+            match = re.search(r'github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$', repo_url)
+            if not match:
+                continue
+            variables[f"o{index}"], variables[f"n{index}"] = match.groups()
+            declarations.append(f"$o{index}: String!, $n{index}: String!")
+            selections.append(f"r{index}: repository(owner: $o{index}, name: $n{index}) {{ {repo_fields} }}")
+        
+        data = {}
+        if selections:
+            query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+            logger.info(f"通过GraphQL批量获取 {len(selections)} 个仓库的摘要信息")
+            
+            response = requests.post(
+                "https://api.github.com/graphql",
+                json={"query": query, "variables": variables},
+                headers={"Authorization": f"Bearer {token}"},
+                timeout=60
+            )
+            response.raise_for_status()
+            data = response.json().get("data") or {}
+        
+        results = []
+        for index, repo_url in enumerate(repo_urls):
+            repo_data = data.get(f"r{index}")
+            if not repo_data:
                 results.append({
                     "status": "error",
-                    "message": str(e),
+                    "message": f"GraphQL未返回仓库信息: {repo_url}",
                     "repo_url": repo_url
                 })
+                continue
+            results.append(self._summarize_graphql_repo(repo_url, repo_data))
         
         return results
     
+    def _summarize_graphql_repo(self, repo_url: str, repo_data: Dict[str, Any]) -> Dict[str, Any]:
+        """将GraphQL仓库数据整理为与analyze_repo一致的结构"""
+        languages = repo_data.get("languages") or {}
+        total_size = languages.get("totalSize") or 0
+        language_stats = {}
+        for edge in languages.get("edges", []):
+            size = edge.get("size", 0)
+            language_stats[edge["node"]["name"]] = {
+                "size_bytes": size,
+                "percentage": round(size / total_size * 100, 2) if total_size else 0
+            }
+        
+        root_entries = {entry["name"] for entry in ((repo_data.get("root") or {}).get("entries") or [])}
+        dependencies = {}
+        if "setup.py" in root_entries or any(re.match(r'.*requirements.*\.txt$', name) for name in root_entries):
+            dependencies["python"] = sorted(set(self._parse_requirements(
+                (repo_data.get("requirements") or {}).get("text") or ""
+            )))
+        if "package.json" in root_entries:
+            try:
+                dependencies["javascript"] = self._parse_package_json(
+                    json.loads((repo_data.get("packageJson") or {}).get("text") or "{}")
+                )
+            except json.JSONDecodeError:
+                dependencies["javascript"] = {}
+        if "pom.xml" in root_entries:
+            dependencies["java"] = {"maven": True}
+        if "Cargo.toml" in root_entries:
+            dependencies["rust"] = {"cargo": True}
+        
+        return {
+            "status": "success",
+            "repo_url": repo_url,
+            "source": "graphql",
+            "analyzed_at": datetime.now().isoformat(),
+            "language_stats": language_stats,
+            "dependencies": dependencies,
+            "readme": (repo_data.get("readme") or {}).get("text") or ""
+        }
+    
     def analyze_repos_from_pwc_results(self, pwc_results_file: str) -> Dict[str, Any]:
         """
         从 Papers with Code 爬取结果中分析仓库
@@ -531,13 +666,7 @@ class GitHubRepoAnalyzer(BaseAnalyzer):
                             python_deps.extend([d[0] for d in deps])
                     else:
                         # 从 requirements.txt 提取
-                        for line in content.split('\n'):
-                            line = line.strip()
-                            if line and not line.startswith('#'):
-                                # 去除版本信息
-                                dep_name = line.split('=')[0].split('>')[0].split('<')[0].strip()
-                                if dep_name:
-                                    python_deps.append(dep_name)
+                        python_deps.extend(self._parse_requirements(content))
             
             dependencies["python"] = sorted(list(set(python_deps)))
         
@@ -546,16 +675,7 @@ class GitHubRepoAnalyzer(BaseAnalyzer):
         if package_json.exists():
             try:
                 with open(package_json, 'r', encoding='utf-8') as f:
-                    package_data = json.load(f)
-                    js_deps = {}
-                    
-                    if "dependencies" in package_data:
-                        js_deps["dependencies"] = list(package_data["dependencies"].keys())
-                    
-                    if "devDependencies" in package_data:
-                        js_deps["devDependencies"] = list(package_data["devDependencies"].keys())
-                    
-                    dependencies["javascript"] = js_deps
+                    dependencies["javascript"] = self._parse_package_json(json.load(f))
             except:
                 pass
         
@@ -572,6 +692,30 @@ class GitHubRepoAnalyzer(BaseAnalyzer):
         # 返回依赖信息
         return dependencies
     
+    def _parse_requirements(self, content: str) -> List[str]:
+        """从 requirements.txt 内容中提取依赖名称"""
+        deps = []
+        for line in content.split('\n'):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                # 去除版本信息
+                dep_name = line.split('=')[0].split('>')[0].split('<')[0].strip()
+                if dep_name:
+                    deps.append(dep_name)
+        return deps
+    
+    def _parse_package_json(self, package_data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """从 package.json 数据中提取依赖名称"""
+        js_deps = {}
+        
+        if "dependencies" in package_data:
+            js_deps["dependencies"] = list(package_data["dependencies"].keys())
+        
+        if "devDependencies" in package_data:
+            js_deps["devDependencies"] = list(package_data["devDependencies"].keys())
+        
+        return js_deps
+    
     def _analyze_structure(self, repo_dir: Path) -> Dict[str, Any]:
         """分析项目结构"""
         # 获取顶层目录和文件
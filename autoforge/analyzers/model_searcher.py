@@ -9,7 +9,7 @@ import json
 
 from .base import BaseAnalyzer
 from ..prompts import PromptManager
-from ..crawler import HuggingFaceCrawler, TaskManager
+from ..crawler import HuggingFaceCrawler
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,8 @@ class ModelSearcher(BaseAnalyzer):
                  save_intermediate: bool = True,
                  prompt_manager: Optional[PromptManager] = None,
                  use_crawler: bool = True,
-                 crawler_config: Optional[Dict[str, Any]] = None):
+                 crawler_config: Optional[Dict[str, Any]] = None,
+                 crawler: Optional[HuggingFaceCrawler] = None):
         """
         初始化模型搜索器
         
@@ -34,6 +35,7 @@ class ModelSearcher(BaseAnalyzer):
             prompt_manager: 提示词管理器
             use_crawler: 是否使用爬虫获取最新模型信息
             crawler_config: 爬虫配置
+            crawler: 外部传入的共享爬虫（可选），传入时忽略crawler_config，复用其会话和任务索引
         """
         super().__init__(llm_client, output_dir, save_intermediate)
         self.prompt_manager = prompt_manager or PromptManager()
@@ -41,14 +43,17 @@ class ModelSearcher(BaseAnalyzer):
         
         # 初始化爬虫
         if self.use_crawler:
-            crawler_config = crawler_config or {}
-            self.crawler = HuggingFaceCrawler(
-                base_url=crawler_config.get('base_url', 'https://hf-mirror.com'),
-                output_dir=crawler_config.get('output_dir', str(self.output_dir / 'hf_models')),
-                max_workers=crawler_config.get('max_workers', 4),
-                delay=crawler_config.get('delay', 1.0)
-            )
-            self.task_manager = TaskManager()
+            if crawler is not None:
+                self.crawler = crawler
+            else:
+                crawler_config = crawler_config or {}
+                self.crawler = HuggingFaceCrawler(
+                    base_url=crawler_config.get('base_url', 'https://hf-mirror.com'),
+                    output_dir=crawler_config.get('output_dir', str(self.output_dir / 'hf_models')),
+                    max_workers=crawler_config.get('max_workers', 4),
+                    delay=crawler_config.get('delay', 1.0)
+                )
+            self.task_manager = self.crawler.task_manager
 
     def analyze(self, requirement_analysis: str, 
                 crawl_models: bool = True,
@@ -4,6 +4,7 @@
 """
 
 import os
+import asyncio
 import logging
 import json
 from pathlib import Path
@@ -385,4 +386,71 @@ class PaperAnalyzer(BaseAnalyzer):
                 })
         
         logger.info(f"批量分析完成，成功: {sum(1 for r in results if r.get('success', False))}/{len(papers)}")
-        return results 
\ No newline at end of file
+        return results 
+    
+    async def analyze_paper_async(self, 
+                                  paper_path: Union[str, Path], 
+                                  paper_meta: Optional[Dict[str, Any]] = None,
+                                  options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        异步分析论文内容
+        
+        LLM客户端目前只提供同步接口，这里在线程池中执行analyze_paper，
+        等待网络I/O时会释放GIL，多篇论文的LLM请求因此可以并行进行。
+        
+        Args:
+            paper_path: 论文PDF路径
+            paper_meta: 论文元数据
+            options: 分析选项
+            
+        Returns:
+            分析结果
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze_paper, paper_path, paper_meta, options)
+    
+    async def analyze_papers_async(self, 
+                                   papers: List[Dict[str, Union[str, Dict]]], 
+                                   options: Optional[Dict[str, Any]] = None,
+                                   max_concurrency: int = 4) -> List[Dict[str, Any]]:
+        """
+        并发批量分析论文
+        
+        Args:
+            papers: 论文列表，每项包含路径和元数据
+                   [{"path": "path/to/paper.pdf", "meta": {...}}, ...]
+            options: 分析选项
+            max_concurrency: 最大并发数（受LLM服务限流约束）
+            
+        Returns:
+            分析结果列表，顺序与有效的输入论文一致
+        """
+        logger.info(f"开始并发分析 {len(papers)} 篇论文（并发数: {max_concurrency}）...")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_analyze(paper: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.analyze_paper_async(paper["path"], paper.get("meta", {}), options)
+                except Exception as e:
+                    logger.error(f"分析论文失败: {e}")
+                    return {
+                        "success": False,
+                        "error": str(e),
+                        "paper_path": paper.get("path", "Unknown"),
+                        "timestamp": datetime.now().isoformat()
+                    }
+        
+        valid_papers = []
+        for paper in papers:
+            paper_path = paper.get("path")
+            if not paper_path or not os.path.exists(paper_path):
+                logger.warning(f"论文路径不存在: {paper_path}")
+                continue
+            valid_papers.append(paper)
+        
+        results = await asyncio.gather(*[bounded_analyze(paper) for paper in valid_papers])
+        
+        logger.info(f"并发分析完成，成功: {sum(1 for r in results if r.get('success', False))}/{len(papers)}")
+        return list(results)
@@ -4,15 +4,20 @@
 """
 
 from .hf_crawler import HuggingFaceCrawler
-from ..analyzers.github_repo_analyzer import GitHubRepoAnalyzer
 from .pwc_crawler import PapersWithCodeCrawler
 from .paper_downloader import PaperDownloader
 from .task_manager import TaskManager
+from ._cache import SQLiteCache
+from ._rate_limit import RateLimiter
+# analyzers包会从本包导入HuggingFaceCrawler和TaskManager，需在它们之后导入
+from ..analyzers.github_repo_analyzer import GitHubRepoAnalyzer
 
 __all__ = [
     "HuggingFaceCrawler",
     "GitHubRepoAnalyzer",
     "PapersWithCodeCrawler",
     "PaperDownloader",
-    "TaskManager"
+    "TaskManager",
+    "SQLiteCache",
+    "RateLimiter"
 ] 
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""
+基于SQLite的爬虫结果缓存
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils import json_loads, json_dumps
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "outputs/.http_cache.sqlite"
+
+
+class SQLiteCache:
+    """
+    SQLite持久化缓存
+
+    以单个数据库文件保存JSON可序列化的结果，跨进程、跨运行复用，
+    相比每条记录一个JSON文件，查找只需一次索引查询。
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: Optional[float] = None):
+        """
+        初始化缓存
+
+        Args:
+            path: 数据库文件路径
+            ttl: 缓存有效期（秒），None表示永不过期
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 爬虫会在线程池中并发读写，连接跨线程共享并由锁串行化
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, ts INTEGER, body BLOB)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        读取缓存
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的值，未命中或已过期时返回None
+        """
+        # 数据库被其他进程锁定或文件损坏时按未命中处理
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT ts, body FROM responses WHERE url = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"读取SQLite缓存失败 {key}: {e}")
+            return None
+        if row is None:
+            return None
+
+        ts, body = row
+        if self.ttl is not None and not 0 <= time.time() - ts < self.ttl:
+            return None
+
+        try:
+            return json_loads(body)
+        except ValueError as e:
+            logger.warning(f"读取SQLite缓存失败 {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any):
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            value: JSON可序列化的值
+        """
+        try:
+            body = json_dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"缓存值无法序列化，跳过写入 {key}: {e}")
+            return
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, ts, body) VALUES (?, ?, ?)",
+                    (key, int(time.time()), body)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"写入SQLite缓存失败 {key}: {e}")
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+
+class DownloadManifest:
+    """
+    下载清单
+
+    记录每篇论文（arXiv ID，非arXiv论文为下载URL）对应的文件及其内容SHA256，
+    用于跳过已下载的论文，并让内容相同的文件通过硬链接共享同一份磁盘数据。
+    """
+
+    def __init__(self, path: str):
+        """
+        初始化清单
+
+        Args:
+            path: 数据库文件路径
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS downloads (arxiv_id TEXT PRIMARY KEY, sha256 TEXT, path TEXT)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS downloads_sha256 ON downloads (sha256)")
+        self._conn.commit()
+
+    def path_for_id(self, paper_id: str) -> Optional[Path]:
+        """
+        按论文标识查找已下载的文件
+
+        Args:
+            paper_id: arXiv ID或下载URL
+
+        Returns:
+            仍存在于磁盘上的文件路径，否则返回None
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT path FROM downloads WHERE arxiv_id = ?", (paper_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"读取下载清单失败 {paper_id}: {e}")
+            return None
+        if row is None or not Path(row[0]).exists():
+            return None
+        return Path(row[0])
+
+    def path_for_hash(self, sha256: str) -> Optional[Path]:
+        """
+        按内容哈希查找已下载的文件
+
+        Args:
+            sha256: 文件内容的SHA256十六进制摘要
+
+        Returns:
+            仍存在于磁盘上的文件路径，否则返回None
+        """
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT path FROM downloads WHERE sha256 = ?", (sha256,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"读取下载清单失败 {sha256}: {e}")
+            return None
+        for (path,) in rows:
+            if Path(path).exists():
+                return Path(path)
+        return None
+
+    def record(self, paper_id: str, sha256: str, path: str):
+        """
+        记录一次下载
+
+        Args:
+            paper_id: arXiv ID或下载URL
+            sha256: 文件内容的SHA256十六进制摘要
+            path: 文件保存路径
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO downloads (arxiv_id, sha256, path) VALUES (?, ?, ?)",
+                    (paper_id, sha256, str(path))
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"写入下载清单失败 {paper_id}: {e}")
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
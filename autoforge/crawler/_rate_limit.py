@@ -0,0 +1,90 @@
+"""
+按主机限制请求频率
+"""
+
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class RateLimiter:
+    """
+    按主机的滑动窗口限流器
+
+    frequencies形如 {'paperswithcode.com': (5, 1.0)}，表示该主机（含子域名）
+    任意 1.0 秒内最多发出 5 个请求。多个爬虫共享同一实例时共用各主机的额度，
+    并发请求各自预约发送时刻，超出额度的请求只等待到窗口内有空位为止。
+    """
+
+    def __init__(self,
+                 frequencies: Dict[str, Tuple[int, float]],
+                 default: Optional[Tuple[int, float]] = None):
+        """
+        初始化限流器
+
+        Args:
+            frequencies: {主机名: (请求数, 时间窗口秒数)}
+            default: 未在frequencies中列出的主机使用的限制，None表示不限制
+        """
+        self.frequencies = {host.lower(): limit for host, limit in frequencies.items()}
+        self.default = default
+        self._history: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def _limit_for(self, host: str) -> Tuple[str, Optional[Tuple[int, float]]]:
+        """
+        查找主机对应的限制，依次尝试完整主机名和各级父域名
+
+        Returns:
+            (额度分组, 限制)：命中frequencies时分组为匹配的域名，同一域名的各子域名共用额度；
+            使用默认限制时每个主机单独计数
+        """
+        parts = host.split('.')
+        for i in range(len(parts)):
+            domain = '.'.join(parts[i:])
+            limit = self.frequencies.get(domain)
+            if limit is not None:
+                return domain, limit
+        return host, self.default
+
+    def _reserve(self, url: str) -> float:
+        """
+        为请求预约发送时刻
+
+        Args:
+            url: 请求URL
+
+        Returns:
+            需要等待的秒数
+        """
+        host = (urlparse(url).hostname or '').lower()
+        bucket, limit = self._limit_for(host)
+        if limit is None:
+            return 0.0
+
+        max_requests, interval = limit
+        with self._lock:
+            now = time.monotonic()
+            history = self._history.setdefault(bucket, deque())
+            while history and now - history[0] >= interval:
+                history.popleft()
+
+            # 窗口已满时，排在最近第max_requests个请求之后一个窗口
+            start = now if len(history) < max_requests else history[-max_requests] + interval
+            history.append(start)
+        return start - now
+
+    def wait(self, url: str):
+        """阻塞直到可以向url所在主机发送请求"""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self, url: str):
+        """异步等待直到可以向url所在主机发送请求"""
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
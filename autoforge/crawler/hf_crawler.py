@@ -5,14 +5,17 @@ HuggingFace模型爬虫
 import os
 import json
 import time
+import asyncio
 import logging
+import importlib.util
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from urllib.parse import urljoin, quote
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 from bs4 import BeautifulSoup
 import yaml
 
@@ -21,6 +24,9 @@ from .parsers import HFModelListParser, HFModelCardParser
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 需要额外安装 h2 包（pip install httpx[http2]）
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class HuggingFaceCrawler:
     """HuggingFace模型爬虫"""
@@ -29,7 +35,8 @@ class HuggingFaceCrawler:
                  base_url: str = "https://hf-mirror.com",
                  output_dir: str = "outputs/hf_models",
                  max_workers: int = 4,
-                 delay: float = 1.0):
+                 delay: float = 1.0,
+                 session: Optional[requests.Session] = None):
         """
         初始化爬虫
         
@@ -38,6 +45,7 @@ class HuggingFaceCrawler:
             output_dir: 输出目录
             max_workers: 并发爬取线程数
             delay: 请求间隔（秒）
+            session: 外部传入的共享会话（可选），由调用方负责关闭
         """
         self.base_url = base_url
         self.output_dir = Path(output_dir)
@@ -55,9 +63,65 @@ class HuggingFaceCrawler:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        # 会话对象
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # 会话对象：外部共享的会话不做修改，请求头随每次请求传入
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+        
+        # 异步HTTP客户端（按事件循环延迟创建）
+        self._async_http_client = None
+        self._async_http_loop = None
+    
+    @property
+    def _async_client(self) -> httpx.AsyncClient:
+        """共享的异步HTTP客户端，复用连接池和TLS会话"""
+        loop = asyncio.get_running_loop()
+        if self._async_http_client is None or self._async_http_loop is not loop:
+            self._async_http_client = httpx.AsyncClient(
+                headers={**self.headers, 'Connection': 'keep-alive'},
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=HTTP2_AVAILABLE,
+                follow_redirects=True,
+                timeout=60.0
+            )
+            self._async_http_loop = loop
+        return self._async_http_client
+    
+    async def aclose(self):
+        """关闭异步HTTP客户端"""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+            self._async_http_loop = None
+    
+    def _run_async(self, coro):
+        """
+        在新的事件循环中运行协程，结束后关闭异步客户端（供同步接口使用）
+        
+        当前线程已有运行中的事件循环时（如Jupyter或异步调用方），
+        在工作线程中运行新的事件循环，避免asyncio.run报错。
+        """
+        async def runner():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(runner())
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, runner()).result()
+    
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """异步获取页面内容"""
+        response = await self._async_client.get(url, params=params)
+        response.raise_for_status()
+        return response.text
     
     def crawl_models_by_task(self, 
                             task_tag: str, 
@@ -90,7 +154,7 @@ class HuggingFaceCrawler:
         
         try:
             # 发送请求
-            response = self.session.get(url, params=params)
+            response = self.session.get(url, params=params, headers=self.headers)
             response.raise_for_status()
             
             # 使用解析器解析页面
@@ -132,25 +196,74 @@ class HuggingFaceCrawler:
             time.sleep(self.delay)
             
             # 发送请求
-            response = self.session.get(url)
+            response = self.session.get(url, headers=self.headers)
             response.raise_for_status()
             
-            # 使用解析器解析页面
-            model_info = HFModelCardParser.parse_model_card(response.text, model_id)
-            model_info['url'] = url
-            model_info['crawled_at'] = datetime.now().isoformat()
-            
-            # 保存ModelCard
-            self._save_model_card(model_id, model_info)
+            return self._process_model_card(model_id, url, response.text)
             
-            logger.info(f"成功爬取模型 '{model_id}' 的信息")
+        except Exception as e:
+            logger.error(f"爬取ModelCard失败: {e}")
+            raise
+    
+    async def crawl_model_card_async(self, model_id: str) -> Dict[str, Any]:
+        """
+        异步爬取单个模型的ModelCard
+        
+        Args:
+            model_id: 模型ID，格式为 'username/model-name'
             
-            return model_info
+        Returns:
+            模型详细信息
+        """
+        logger.info(f"开始爬取模型 '{model_id}' 的ModelCard...")
+        
+        url = f"{self.base_url}/{model_id}"
+        
+        try:
+            await asyncio.sleep(self.delay)
+            html_content = await self._fetch(url)
+            return self._process_model_card(model_id, url, html_content)
             
         except Exception as e:
             logger.error(f"爬取ModelCard失败: {e}")
             raise
     
+    async def crawl_model_cards_async(self, model_ids: List[str]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        并发爬取多个模型的ModelCard
+        
+        Args:
+            model_ids: 模型ID列表
+            
+        Returns:
+            与model_ids顺序一致的结果列表，失败的项为对应的异常对象
+        """
+        # 限制并发数，避免对镜像站造成过大压力
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def bounded_crawl(model_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.crawl_model_card_async(model_id)
+        
+        return await asyncio.gather(
+            *[bounded_crawl(model_id) for model_id in model_ids],
+            return_exceptions=True
+        )
+    
+    def _process_model_card(self, model_id: str, url: str, html_content: str) -> Dict[str, Any]:
+        """解析并保存ModelCard页面"""
+        # 使用解析器解析页面
+        model_info = HFModelCardParser.parse_model_card(html_content, model_id)
+        model_info['url'] = url
+        model_info['crawled_at'] = datetime.now().isoformat()
+        
+        # 保存ModelCard
+        self._save_model_card(model_id, model_info)
+        
+        logger.info(f"成功爬取模型 '{model_id}' 的信息")
+        
+        return model_info
+    
     def crawl_models_batch(self, 
                           task_tag: str,
                           sort: str = "trending",
@@ -174,26 +287,22 @@ class HuggingFaceCrawler:
         if not fetch_details:
             return models
         
-        # 并发爬取模型详情
+        # 并发爬取模型详情（共享异步连接池）
         logger.info(f"开始批量爬取 {len(models)} 个模型的详细信息...")
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_model = {
-                executor.submit(self.crawl_model_card, model['model_id']): model
-                for model in models if 'model_id' in model
-            }
-            
-            detailed_models = []
-            for future in as_completed(future_to_model):
-                model = future_to_model[future]
-                try:
-                    detail = future.result()
-                    # 合并列表信息和详细信息
-                    model.update(detail)
-                    detailed_models.append(model)
-                except Exception as e:
-                    logger.error(f"爬取模型 '{model.get('model_id')}' 详情失败: {e}")
-                    detailed_models.append(model)
+        models = [model for model in models if 'model_id' in model]
+        details = self._run_async(
+            self.crawl_model_cards_async([model['model_id'] for model in models])
+        )
+        
+        detailed_models = []
+        for model, detail in zip(models, details):
+            if isinstance(detail, Exception):
+                logger.error(f"爬取模型 '{model.get('model_id')}' 详情失败: {detail}")
+            else:
+                # 合并列表信息和详细信息
+                model.update(detail)
+            detailed_models.append(model)
         
         # 保存完整的批量爬取结果
         self._save_batch_result(task_tag, sort, detailed_models)
@@ -280,22 +389,48 @@ class HuggingFaceCrawler:
         params = {'search': query}
         
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.get(url, params=params, headers=self.headers)
             response.raise_for_status()
             
-            models = HFModelListParser.parse_model_list(response.text, top_k)
+            return self._process_search_results(response.text, top_k)
             
-            # 补充完整URL
-            for model in models:
-                if 'url' in model and not model['url'].startswith('http'):
-                    model['url'] = urljoin(self.base_url, model['url'])
+        except Exception as e:
+            logger.error(f"搜索模型失败: {e}")
+            raise
+    
+    async def search_models_async(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        异步搜索模型
+        
+        Args:
+            query: 搜索关键词
+            top_k: 返回结果数量
             
-            return models
+        Returns:
+            模型列表
+        """
+        url = f"{self.base_url}/models"
+        params = {'search': query}
+        
+        try:
+            html_content = await self._fetch(url, params=params)
+            return self._process_search_results(html_content, top_k)
             
         except Exception as e:
             logger.error(f"搜索模型失败: {e}")
             raise
     
+    def _process_search_results(self, html_content: str, top_k: int) -> List[Dict[str, Any]]:
+        """解析搜索结果页面"""
+        models = HFModelListParser.parse_model_list(html_content, top_k)
+        
+        # 补充完整URL
+        for model in models:
+            if 'url' in model and not model['url'].startswith('http'):
+                model['url'] = urljoin(self.base_url, model['url'])
+        
+        return models
+    
     def get_available_tasks(self) -> str:
         """获取所有可用的任务类型"""
         return self.task_manager.format_task_list()
@@ -5,7 +5,10 @@
 
 import os
 import re
+import mmap
 import time
+import asyncio
+import hashlib
 import logging
 import requests
 from pathlib import Path
@@ -13,8 +16,20 @@ from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse, unquote
 import random
 
+from ._cache import DownloadManifest
+from ._rate_limit import RateLimiter
+
 logger = logging.getLogger(__name__)
 
+# 延迟导入，避免依赖问题
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# 下载分块大小：16个内存页（通常为64KB），与页缓存对齐
+DOWNLOAD_CHUNK_SIZE = mmap.PAGESIZE * 16
+
 
 class PaperDownloader:
     """论文下载器"""
@@ -23,7 +38,9 @@ class PaperDownloader:
                  output_dir: str = "outputs/papers",
                  max_retries: int = 3,
                  delay: float = 1.0,
-                 timeout: int = 60):
+                 timeout: int = 60,
+                 session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         """
         初始化下载器
         
@@ -32,15 +49,21 @@ class PaperDownloader:
             max_retries: 最大重试次数
             delay: 请求间隔（秒）
             timeout: 请求超时时间（秒）
+            session: 外部传入的共享会话（可选），由调用方负责关闭
+            rate_limiter: 按主机的限流器（可选），与其他爬虫共享时共用各主机的请求额度
         """
         self.output_dir = Path(output_dir)
         self.max_retries = max_retries
         self.delay = delay
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
         
         # 创建输出目录
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # 下载清单：按arXiv ID跳过已下载的论文，内容相同的文件以硬链接共享
+        self.manifest = DownloadManifest(self.output_dir / ".manifest.db")
+        
         # 设置请求头
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -60,9 +83,25 @@ class PaperDownloader:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         ]
         
-        # 会话对象
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # 会话对象：外部共享的会话不做修改，请求头随每次请求传入
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+    
+    def close(self):
+        """关闭下载清单和会话（外部传入的共享会话由调用方关闭）"""
+        self.manifest.close()
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def download_paper(self, url: str, filename: Optional[str] = None) -> Optional[str]:
         """
@@ -110,13 +149,18 @@ class PaperDownloader:
             logger.info(f"论文已存在，跳过下载: {save_path}")
             return str(save_path)
         
+        # 同一论文已以其他文件名下载过时直接复用
+        paper_id = self._paper_id(url)
+        existing = self.manifest.path_for_id(paper_id)
+        if existing is not None:
+            logger.info(f"论文已下载，跳过下载: {existing}")
+            return str(existing)
+        
         # 下载文件
         for attempt in range(self.max_retries + 1):
             try:
                 # 随机使用不同的用户代理
-                self.session.headers.update({
-                    'User-Agent': random.choice(self.user_agents)
-                })
+                headers = {**self.headers, 'User-Agent': random.choice(self.user_agents)}
                 
                 # 添加随机延迟
                 if attempt > 0:
@@ -127,9 +171,13 @@ class PaperDownloader:
                 else:
                     time.sleep(self.delay)
                 
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait(url)
+                
                 # 发送请求
                 response = self.session.get(
                     url, 
+                    headers=headers,
                     timeout=self.timeout,
                     stream=True  # 流式下载大文件
                 )
@@ -140,11 +188,15 @@ class PaperDownloader:
                 if 'application/pdf' not in content_type and 'octet-stream' not in content_type:
                     logger.warning(f"下载的内容可能不是PDF，Content-Type: {content_type}")
                 
-                # 保存文件
-                with open(save_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                # 先写入临时文件并同时计算内容哈希，完成后再放到保存路径
+                part_path = save_path.with_name(save_path.name + '.part')
+                digest = hashlib.sha256()
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         if chunk:
                             f.write(chunk)
+                            digest.update(chunk)
+                self._commit_download(paper_id, part_path, save_path, digest.hexdigest())
                 
                 logger.info(f"论文下载成功: {save_path}")
                 return str(save_path)
@@ -231,7 +283,8 @@ class PaperDownloader:
             for pattern in patterns:
                 match = re.search(pattern, url)
                 if match:
-                    return match.group(1)
+                    # 去掉 ".pdf" 后缀残留的点号
+                    return match.group(1).rstrip('.')
         
         # 处理纯ID格式（如1234.5678）
         elif re.match(r'^[0-9]{4}\.[0-9]{4,5}(v[0-9]+)?$', url):
@@ -275,16 +328,26 @@ class PaperDownloader:
         
         return filename
     
-    def download_papers_batch(self, urls: List[str]) -> Dict[str, Optional[str]]:
+    def download_papers_batch(self, urls: List[str], max_concurrency: int = 8) -> Dict[str, Optional[str]]:
         """
         批量下载论文
         
+        安装了aiohttp且当前线程没有运行中的事件循环时，通过download_papers_async并发下载；
+        否则逐个同步下载。
+        
         Args:
             urls: 论文URL列表
+            max_concurrency: 最大并发下载数
             
         Returns:
             字典，键为URL，值为保存路径
         """
+        if aiohttp is not None:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.download_papers_async(urls, max_concurrency))
+        
         logger.info(f"开始批量下载 {len(urls)} 篇论文...")
         
         results = {}
@@ -299,4 +362,254 @@ class PaperDownloader:
         success_count = sum(1 for path in results.values() if path)
         logger.info(f"批量下载完成，成功: {success_count}/{len(urls)}")
         
-        return results 
\ No newline at end of file
+        return results 
+    
+    async def download_papers_async(self,
+                                    urls: List[str],
+                                    max_concurrency: int = 8) -> Dict[str, Optional[str]]:
+        """
+        并发批量下载论文
+        
+        所有下载共享一个aiohttp会话（keep-alive连接池），并发数由信号量限制。
+        
+        Args:
+            urls: 论文URL列表
+            max_concurrency: 最大并发下载数
+            
+        Returns:
+            字典，键为URL，值为保存路径（下载失败为None）
+        """
+        if aiohttp is None:
+            raise ImportError("请安装aiohttp包: pip install aiohttp")
+        
+        logger.info(f"开始并发下载 {len(urls)} 篇论文（并发数: {max_concurrency}）...")
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=8, ttl_dns_cache=300)
+        # aiohttp默认不支持br解码，PDF下载无需压缩
+        headers = {**self.headers, 'Accept-Encoding': 'gzip, deflate'}
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+            async def bounded_download(url: str) -> Optional[str]:
+                async with semaphore:
+                    try:
+                        return await self.download_paper_async(session, url)
+                    except Exception as e:
+                        logger.error(f"下载论文失败: {url}, 错误: {e}")
+                        return None
+            
+            paths = await asyncio.gather(*[bounded_download(url) for url in urls])
+        
+        results = dict(zip(urls, paths))
+        success_count = sum(1 for path in results.values() if path)
+        logger.info(f"并发下载完成，成功: {success_count}/{len(urls)}")
+        
+        return results
+    
+    async def download_paper_async(self,
+                                   session: "aiohttp.ClientSession",
+                                   url: str,
+                                   filename: Optional[str] = None) -> Optional[str]:
+        """
+        使用aiohttp异步下载单篇论文
+        
+        Args:
+            session: aiohttp会话
+            url: 论文URL（支持arXiv链接）
+            filename: 保存的文件名（可选）
+            
+        Returns:
+            论文保存路径，下载失败返回None
+        """
+        target = self._resolve_download_target(url, filename)
+        if target is None:
+            return None
+        download_url, save_path = target
+        
+        # 如果文件已存在，直接返回路径
+        if save_path.exists():
+            logger.info(f"论文已存在，跳过下载: {save_path}")
+            return str(save_path)
+        
+        # 同一论文已以其他文件名下载过时直接复用
+        paper_id = self._paper_id(download_url)
+        existing = self.manifest.path_for_id(paper_id)
+        if existing is not None:
+            logger.info(f"论文已下载，跳过下载: {existing}")
+            return str(existing)
+        
+        logger.info(f"开始下载论文: {download_url}")
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                # 添加随机延迟
+                if attempt > 0:
+                    jitter = random.uniform(0.5, 2.0)
+                    sleep_time = self.delay * (2 ** attempt) * jitter
+                    logger.info(f"第 {attempt} 次重试，等待 {sleep_time:.2f} 秒...")
+                    await asyncio.sleep(sleep_time)
+                else:
+                    await asyncio.sleep(self.delay)
+                
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.wait_async(download_url)
+                
+                async with session.get(
+                    download_url,
+                    timeout=timeout,
+                    headers={'User-Agent': random.choice(self.user_agents)}
+                ) as response:
+                    response.raise_for_status()
+                    
+                    # 检查内容类型
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'application/pdf' not in content_type and 'octet-stream' not in content_type:
+                        logger.warning(f"下载的内容可能不是PDF，Content-Type: {content_type}")
+                    
+                    # 先写入临时文件，完成后再重命名，避免残留不完整的文件
+                    part_path = save_path.with_name(save_path.name + '.part')
+                    digest = hashlib.sha256()
+                    # 已知文件大小且未压缩传输时预分配磁盘空间
+                    size = None
+                    if response.content_length and 'Content-Encoding' not in response.headers:
+                        size = response.content_length
+                    
+                    # 文件操作和哈希计算都在线程池中执行，不阻塞事件循环中的其他下载；
+                    # 上一块写入的同时读取下一块数据
+                    loop = asyncio.get_running_loop()
+                    f = await loop.run_in_executor(None, self._open_part_file, part_path, size)
+                    pending = None
+                    try:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            if pending is not None:
+                                await pending
+                            pending = loop.run_in_executor(None, self._write_chunk, f, digest, chunk)
+                        if pending is not None:
+                            await pending
+                            pending = None
+                        # 实际长度与预分配不一致时以实际写入为准
+                        await loop.run_in_executor(None, f.truncate, f.tell())
+                    finally:
+                        # 出错时等待进行中的写入结束后再关闭文件
+                        if pending is not None:
+                            await asyncio.gather(pending, return_exceptions=True)
+                        await loop.run_in_executor(None, f.close)
+                    await loop.run_in_executor(
+                        None, self._commit_download, paper_id, part_path, save_path, digest.hexdigest()
+                    )
+                
+                logger.info(f"论文下载成功: {save_path}")
+                return str(save_path)
+                
+            except aiohttp.ClientResponseError as e:
+                logger.warning(f"HTTP错误 (尝试 {attempt+1}/{self.max_retries+1}): {e}")
+                if e.status == 404:
+                    # 404错误不重试
+                    logger.error(f"论文不存在 (404): {download_url}")
+                    return None
+            
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                logger.warning(f"请求超时或连接错误 (尝试 {attempt+1}/{self.max_retries+1}): {e}")
+            
+            if attempt == self.max_retries:
+                logger.error(f"下载失败，已达最大重试次数: {download_url}")
+        
+        return None
+    
+    def _paper_id(self, url: str) -> str:
+        """下载清单中的论文标识：arXiv论文为arXiv ID，其他论文为URL"""
+        if 'arxiv.org' in url:
+            arxiv_id = self._extract_arxiv_id(url)
+            if arxiv_id:
+                return arxiv_id
+        return url
+    
+    def _commit_download(self, paper_id: str, part_path: Path, save_path: Path, sha256: str):
+        """
+        将下载完成的临时文件放到保存路径并记录到下载清单
+        
+        内容与已下载的文件相同时删除临时文件，改为硬链接到已有文件；
+        文件系统不支持硬链接时保留新下载的文件。
+        
+        Args:
+            paper_id: arXiv ID或下载URL
+            part_path: 下载完成的临时文件
+            save_path: 保存路径
+            sha256: 文件内容的SHA256十六进制摘要
+        """
+        existing = self.manifest.path_for_hash(sha256)
+        if existing is not None and existing != save_path:
+            try:
+                os.link(existing, save_path)
+                part_path.unlink()
+                logger.info(f"论文内容与已下载文件相同，创建硬链接: {save_path} -> {existing}")
+            except OSError as e:
+                logger.debug(f"创建硬链接失败，保留下载的文件: {e}")
+                part_path.replace(save_path)
+        else:
+            part_path.replace(save_path)
+        self.manifest.record(paper_id, sha256, str(save_path))
+    
+    @classmethod
+    def _open_part_file(cls, part_path: Path, size: Optional[int] = None):
+        """
+        打开下载用的临时文件
+        
+        Args:
+            part_path: 临时文件路径
+            size: 预期文件大小（可选），提供时预分配磁盘空间
+            
+        Returns:
+            以二进制写模式打开的文件对象
+        """
+        f = open(part_path, 'wb')
+        if size:
+            cls._preallocate(f, size)
+        return f
+    
+    @staticmethod
+    def _write_chunk(f, digest, chunk: bytes):
+        """写入一块数据并更新内容哈希"""
+        f.write(chunk)
+        digest.update(chunk)
+    
+    @staticmethod
+    def _preallocate(f, size: int):
+        """为文件预分配磁盘空间，使文件系统连续布局；平台或文件系统不支持时忽略"""
+        if not hasattr(os, 'posix_fallocate'):
+            return
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError as e:
+            logger.debug(f"预分配磁盘空间失败，跳过: {e}")
+    
+    def _resolve_download_target(self, url: str, filename: Optional[str] = None) -> Optional[Tuple[str, Path]]:
+        """
+        确定实际下载地址和保存路径
+        
+        Args:
+            url: 论文URL
+            filename: 保存的文件名（可选）
+            
+        Returns:
+            (下载URL, 保存路径)，无法解析时返回None
+        """
+        download_url = url
+        
+        if 'arxiv.org' in url:
+            arxiv_id = self._extract_arxiv_id(url)
+            if not arxiv_id:
+                logger.error(f"无法提取arXiv ID: {url}")
+                return None
+            download_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+            if not filename:
+                filename = f"arxiv_{arxiv_id.replace('.', '_').replace('/', '_')}.pdf"
+        elif not filename:
+            filename = self._generate_filename_from_url(url)
+        
+        # 确保文件名有.pdf后缀
+        if not filename.lower().endswith('.pdf'):
+            filename = f"{filename}.pdf"
+        
+        return download_url, self.output_dir / filename
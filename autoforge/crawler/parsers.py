@@ -8,9 +8,28 @@ import logging
 from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401
+    # lxml的C解析器构建文档树比内置html.parser快数倍，模型列表页通常较大
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 logger = logging.getLogger(__name__)
 
 
+def _release_soup(soup: BeautifulSoup):
+    """
+    拆除文档树，立即释放内存
+    
+    文档树中父子节点互相引用，只能等循环垃圾回收释放，逐页解析大页面时内存会堆积。
+    解析结果均为普通字符串，不引用文档树，提取完成后逐个拆除根节点的子树即可直接释放
+    （对BeautifulSoup对象本身调用decompose不会拆除子树）。
+    """
+    for child in list(soup.contents):
+        child.decompose()
+
+
 class HFModelListParser:
     """HuggingFace模型列表页面解析器"""
     
@@ -26,40 +45,43 @@ class HFModelListParser:
         Returns:
             模型信息列表
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         models = []
         
-        # 方法1: 查找article标签（通常包含模型卡片）
-        articles = soup.find_all('article', limit=top_k)
-        
-        if articles:
-            for article in articles:
-                model_info = HFModelListParser._parse_article_card(article)
-                if model_info and model_info.get('model_id'):
-                    models.append(model_info)
-        
-        # 方法2: 如果article不存在，尝试其他结构
-        if not models:
-            # 查找包含模型链接的div
-            model_divs = soup.find_all('div', class_=re.compile(r'model|card'), limit=top_k*2)
+        try:
+            # 方法1: 查找article标签（通常包含模型卡片）
+            articles = soup.find_all('article', limit=top_k)
             
-            for div in model_divs:
-                model_info = HFModelListParser._parse_div_card(div)
-                if model_info and model_info.get('model_id'):
-                    models.append(model_info)
-                    if len(models) >= top_k:
-                        break
-        
-        # 方法3: 查找直接的链接列表
-        if not models:
-            links = soup.find_all('a', href=re.compile(r'^/[\w-]+/[\w.-]+$'), limit=top_k*2)
+            if articles:
+                for article in articles:
+                    model_info = HFModelListParser._parse_article_card(article)
+                    if model_info and model_info.get('model_id'):
+                        models.append(model_info)
+            
+            # 方法2: 如果article不存在，尝试其他结构
+            if not models:
+                # 查找包含模型链接的div
+                model_divs = soup.find_all('div', class_=re.compile(r'model|card'), limit=top_k*2)
+                
+                for div in model_divs:
+                    model_info = HFModelListParser._parse_div_card(div)
+                    if model_info and model_info.get('model_id'):
+                        models.append(model_info)
+                        if len(models) >= top_k:
+                            break
             
-            for link in links:
-                model_info = HFModelListParser._parse_link(link)
-                if model_info and model_info.get('model_id'):
-                    models.append(model_info)
-                    if len(models) >= top_k:
-                        break
+            # 方法3: 查找直接的链接列表
+            if not models:
+                links = soup.find_all('a', href=re.compile(r'^/[\w-]+/[\w.-]+$'), limit=top_k*2)
+                
+                for link in links:
+                    model_info = HFModelListParser._parse_link(link)
+                    if model_info and model_info.get('model_id'):
+                        models.append(model_info)
+                        if len(models) >= top_k:
+                            break
+        finally:
+            _release_soup(soup)
         
         logger.info(f"解析出 {len(models)} 个模型")
         return models[:top_k]
@@ -188,30 +210,33 @@ class HFModelCardParser:
         Returns:
             模型详细信息
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         model_info = {
             'model_id': model_id
         }
         
-        # 提取ModelCard内容
-        model_card_content = HFModelCardParser._extract_model_card(soup)
-        if model_card_content:
-            model_info['model_card'] = model_card_content
-        
-        # 提取元数据
-        metadata = HFModelCardParser._extract_metadata(soup)
-        if metadata:
-            model_info['metadata'] = metadata
-        
-        # 提取文件列表
-        files = HFModelCardParser._extract_files(soup)
-        if files:
-            model_info['files'] = files
-        
-        # 提取统计信息
-        stats = HFModelCardParser._extract_stats(soup)
-        if stats:
-            model_info['stats'] = stats
+        try:
+            # 提取ModelCard内容
+            model_card_content = HFModelCardParser._extract_model_card(soup)
+            if model_card_content:
+                model_info['model_card'] = model_card_content
+            
+            # 提取元数据
+            metadata = HFModelCardParser._extract_metadata(soup)
+            if metadata:
+                model_info['metadata'] = metadata
+            
+            # 提取文件列表
+            files = HFModelCardParser._extract_files(soup)
+            if files:
+                model_info['files'] = files
+            
+            # 提取统计信息
+            stats = HFModelCardParser._extract_stats(soup)
+            if stats:
+                model_info['stats'] = stats
+        finally:
+            _release_soup(soup)
         
         return model_info
     
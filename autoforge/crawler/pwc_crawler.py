@@ -4,14 +4,20 @@ Papers with Code 爬虫模块
 """
 
 import os
+import copy
 import json
 import time
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 import requests
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import random
 
@@ -20,19 +26,54 @@ import re
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ._cache import SQLiteCache
+from ..utils import json_loads, json_dumps
+from ._rate_limit import RateLimiter
+
+# 延迟导入，避免依赖问题
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import lxml  # noqa: F401
+    # lxml的C解析器构建文档树比内置html.parser快数倍
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 logger = logging.getLogger(__name__)
 
+# 搜索页结构分析用的关键词，预编译为单个多选正则，一次扫描即可匹配所有关键词
+PAPER_CLASS_PATTERN = re.compile(r'paper|item|result', re.IGNORECASE)
+NO_RESULTS_PATTERN = re.compile(
+    r'no results|no papers|not found|0 results|nothing found', re.IGNORECASE
+)
+
 
 class PapersWithCodeCrawler:
     """Papers with Code 爬虫"""
     
+    # 重试退避的最长等待时间（秒），不限制服务端通过Retry-After指定的时间
+    MAX_BACKOFF = 60.0
+    # 合并搜索时单次请求包含的最大搜索词数，过多会使站点查询变慢且结果难以区分
+    SEARCH_BATCH_SIZE = 10
+    
     def __init__(self, 
                  base_url: str = "https://paperswithcode.com",
                  output_dir: str = "outputs/pwc_papers",
                  max_workers: int = 4,
                  delay: float = 1.0,
                  max_retries: int = 3,
-                 timeout: int = 60):
+                 timeout: int = 60,
+                 cache_dir: Optional[str] = None,
+                 cache_size: int = 512,
+                 user_agents: Optional[List[str]] = None,
+                 delay_jitter: float = 0.5,
+                 session: Optional[requests.Session] = None,
+                 cache: Optional[SQLiteCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
         """
         初始化爬虫
         
@@ -43,17 +84,36 @@ class PapersWithCodeCrawler:
             delay: 请求间隔（秒）
             max_retries: 最大重试次数
             timeout: 请求超时时间（秒）
+            cache_dir: 磁盘缓存目录（可选），设置后搜索结果与论文详情会跨运行复用
+            cache_size: 内存缓存的最大条目数（LRU淘汰）
+            user_agents: 轮换使用的User-Agent列表，默认使用内置列表
+            delay_jitter: 请求间隔的随机增量比例，实际间隔为 delay + [0, delay * delay_jitter]
+            session: 外部传入的共享会话（可选），多个爬虫共用时复用同一连接池；
+                由调用方负责配置与关闭，此时不挂载本爬虫的重试策略
+            cache: SQLite持久化缓存（可选），搜索结果与论文详情写入单个数据库文件跨运行复用
+            rate_limiter: 按主机的限流器（可选），与其他爬虫共享时共用各主机的请求额度
         """
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.max_workers = max_workers
         self.delay = delay
+        self.delay_jitter = delay_jitter
         self.max_retries = max_retries
         self.timeout = timeout
         
         # 创建输出目录
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # 结果缓存：内存层 + 可选的磁盘层
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         # 设置请求头
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -67,13 +127,19 @@ class PapersWithCodeCrawler:
         }
         
         # 随机用户代理
-        self.user_agents = [
+        self.user_agents = user_agents or [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15',
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/116.0',
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         ]
+        self.accept_languages = [
+            'zh-CN,zh;q=0.9,en;q=0.8',
+            'en-US,en;q=0.9',
+            'en-US,en;q=0.9,zh-CN;q=0.8',
+            'en-GB,en;q=0.9,en-US;q=0.8',
+        ]
         
         # 设置重试策略
         retry_strategy = Retry(
@@ -81,41 +147,72 @@ class PapersWithCodeCrawler:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
             backoff_factor=1,
+            respect_retry_after_header=True,
+            # 重试耗尽后返回最后的响应，交由_get_with_retry按Retry-After继续退避
+            raise_on_status=False,
+        )
+        # 连接池：同一主机的请求复用TCP/TLS连接，池大小需覆盖并发线程数
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(20, self.max_workers),
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         
-        # 会话对象
-        self.session = requests.Session()
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
-        self.session.headers.update(self.headers)
+        # 会话对象：外部共享的会话不做修改，请求头随每次请求传入
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(self.headers)
     
     def _get_with_retry(self, url, params=None, **kwargs):
-        """发送GET请求，带重试机制"""
+        """发送GET请求，带重试机制；启用cache_dir时使用ETag/Last-Modified条件请求"""
+        validator_file = self._validator_file(url, params)
+        validators = self._load_validators(validator_file)
+        
+        headers = kwargs.pop('headers', {})
+        if validators:
+            if validators.get('etag'):
+                headers.setdefault('If-None-Match', validators['etag'])
+            if validators.get('last_modified'):
+                headers.setdefault('If-Modified-Since', validators['last_modified'])
+        
+        retry_after = None
         for attempt in range(self.max_retries + 1):
             try:
-                # 随机使用不同的用户代理
-                self.session.headers.update({
-                    'User-Agent': random.choice(self.user_agents)
-                })
-                
                 # 添加随机延迟，避免被识别为爬虫
                 if attempt > 0:
-                    jitter = random.uniform(0.5, 2.0)
-                    sleep_time = self.delay * (2 ** attempt) * jitter
+                    sleep_time = self._backoff_delay(attempt, retry_after)
                     logger.info(f"第 {attempt} 次重试，等待 {sleep_time:.2f} 秒...")
                     time.sleep(sleep_time)
                 else:
-                    time.sleep(self.delay)
+                    time.sleep(self._request_delay())
+                
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait(url)
                 
-                # 发送请求
+                # 发送请求（每次随机使用不同的用户代理和语言偏好）
                 response = self.session.get(
                     url, 
                     params=params, 
                     timeout=self.timeout,
+                    headers={**self.headers, **self._random_headers(), **headers},
                     **kwargs
                 )
+                
+                # 页面未修改，使用本地保存的内容
+                if response.status_code == 304 and validators:
+                    logger.info(f"页面未修改，使用本地缓存: {url}")
+                    response._content = validators['body'].encode('utf-8')
+                    response.encoding = 'utf-8'
+                    response.status_code = 200
+                    return response
+                
                 response.raise_for_status()
+                self._store_validators(validator_file, response)
                 return response
             
             except (requests.exceptions.Timeout, 
@@ -131,12 +228,200 @@ class PapersWithCodeCrawler:
                     raise
                 if attempt == self.max_retries:
                     raise
+                retry_after = e.response.headers.get('Retry-After')
             
             except Exception as e:
                 logger.warning(f"未知错误 (尝试 {attempt+1}/{self.max_retries+1}): {e}")
                 if attempt == self.max_retries:
                     raise
     
+    def _random_headers(self) -> Dict[str, str]:
+        """随机选择User-Agent和Accept-Language，降低被识别为爬虫的概率"""
+        return {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept-Language': random.choice(self.accept_languages),
+        }
+    
+    def _request_delay(self) -> float:
+        """请求间隔：固定阈值加随机增量，避免固定频率的访问特征"""
+        return self.delay + random.uniform(0, self.delay * self.delay_jitter)
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        计算重试前的等待时间
+        
+        服务端返回Retry-After（429/503）时按其要求等待；否则使用带随机抖动的
+        指数退避，避免并发请求在同一时刻集中重试。
+        
+        Args:
+            attempt: 当前重试次数（从1开始）
+            retry_after: 上一次响应的Retry-After头（秒数或HTTP日期）
+            
+        Returns:
+            等待秒数
+        """
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+        return min(self.MAX_BACKOFF, self.delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+    
+    def _validator_file(self, url: str, params=None) -> Optional[Path]:
+        """条件请求校验信息的保存路径，未启用cache_dir时返回None"""
+        if not self.cache_dir:
+            return None
+        raw = json.dumps([url, params or {}], ensure_ascii=False, sort_keys=True)
+        digest = hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / "http" / f"{digest}.json"
+    
+    def _load_validators(self, validator_file: Optional[Path]) -> Optional[Dict[str, str]]:
+        """读取页面的ETag/Last-Modified及对应内容"""
+        if not validator_file or not validator_file.exists():
+            return None
+        try:
+            return json_loads(validator_file.read_bytes())
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"读取条件请求缓存失败 {validator_file}: {e}")
+            return None
+    
+    def _store_validators(self, validator_file: Optional[Path], response: requests.Response):
+        """保存响应的ETag/Last-Modified及内容，供下次条件请求使用"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not validator_file or not (etag or last_modified):
+            return
+        
+        # 确保正确编码
+        if response.encoding == 'ISO-8859-1':
+            response.encoding = 'utf-8'
+        
+        try:
+            validator_file.parent.mkdir(parents=True, exist_ok=True)
+            validator_file.write_bytes(json_dumps({
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': response.text
+            }))
+        except OSError as e:
+            logger.warning(f"写入条件请求缓存失败 {validator_file}: {e}")
+    
+    def close(self):
+        """关闭会话，释放连接池（外部传入的共享会话由调用方关闭）"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    async def _get_text_async(self, session: "aiohttp.ClientSession", url: str, params=None) -> str:
+        """异步发送GET请求并返回页面文本，带重试机制"""
+        retry_after = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                # 添加随机延迟，避免被识别为爬虫
+                if attempt > 0:
+                    sleep_time = self._backoff_delay(attempt, retry_after)
+                    logger.info(f"第 {attempt} 次重试，等待 {sleep_time:.2f} 秒...")
+                    await asyncio.sleep(sleep_time)
+                else:
+                    await asyncio.sleep(self._request_delay())
+                
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.wait_async(url)
+                
+                async with session.get(
+                    url,
+                    params=params,
+                    headers=self._random_headers()
+                ) as response:
+                    response.raise_for_status()
+                    return await response.text(errors='replace')
+            
+            except aiohttp.ClientResponseError as e:
+                logger.warning(f"HTTP错误 (尝试 {attempt+1}/{self.max_retries+1}): {e}")
+                if e.status == 404:
+                    # 404错误不重试
+                    raise
+                if attempt == self.max_retries:
+                    raise
+                retry_after = e.headers.get('Retry-After') if e.headers else None
+            
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                logger.warning(f"请求超时或连接错误 (尝试 {attempt+1}/{self.max_retries+1}): {e}")
+                if attempt == self.max_retries:
+                    raise
+    
+    def _cache_key(self, namespace: str, *parts) -> str:
+        """根据命名空间和参数生成缓存键"""
+        raw = json.dumps([namespace, self.base_url, *parts], ensure_ascii=False)
+        return f"{namespace}_{hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()}"
+    
+    def _cache_get(self, namespace: str, *parts) -> Optional[Any]:
+        """读取缓存结果，未命中时返回None"""
+        key = self._cache_key(namespace, *parts)
+        
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(self._cache[key])
+        
+        if self.cache is not None:
+            value = self.cache.get(key)
+            if value is not None:
+                self._remember(key, value)
+                return copy.deepcopy(value)
+        
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            if cache_file.exists():
+                try:
+                    value = json_loads(cache_file.read_bytes())
+                    self._remember(key, value)
+                    return copy.deepcopy(value)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"读取缓存失败 {cache_file}: {e}")
+        
+        return None
+    
+    def _cache_set(self, namespace: str, value: Any, *parts):
+        """写入缓存结果"""
+        key = self._cache_key(namespace, *parts)
+        
+        self._remember(key, copy.deepcopy(value))
+        
+        if self.cache is not None:
+            self.cache.set(key, value)
+        
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            try:
+                cache_file.write_bytes(json_dumps(value))
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"写入缓存失败 {cache_file}: {e}")
+    
+    def _remember(self, key: str, value: Any):
+        """写入内存缓存，超出容量时淘汰最久未使用的条目"""
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _normalize_url(self, url: str) -> str:
+        """规范化论文URL（补全域名、主机名小写、去掉末尾斜杠），使同一页面共用缓存"""
+        if not url.startswith('http'):
+            url = urljoin(self.base_url, url)
+        parsed = urlparse(url)
+        return parsed._replace(netloc=parsed.netloc.lower(), path=parsed.path.rstrip('/') or '/').geturl()
+    
     def crawl_trending_papers(self, top_k: int = 10) -> List[Dict[str, Any]]:
         """
         爬取热门论文列表
@@ -158,7 +443,7 @@ class PapersWithCodeCrawler:
             if response.encoding == 'ISO-8859-1':
                 response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # 查找热门论文部分 - 根据最新的页面结构进行查找
             papers = []
@@ -219,7 +504,7 @@ class PapersWithCodeCrawler:
             if response.encoding == 'ISO-8859-1':
                 response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             papers = []
             
@@ -263,66 +548,103 @@ class PapersWithCodeCrawler:
         Returns:
             论文详细信息
         """
+        paper_url = self._normalize_url(paper_url)
+        
+        cached = self._cache_get("details", paper_url)
+        if cached is not None:
+            logger.info(f"命中论文详情缓存: {paper_url}")
+            return cached
+        
         logger.info(f"开始爬取论文详情: {paper_url}")
         
         try:
-            if not paper_url.startswith('http'):
-                paper_url = urljoin(self.base_url, paper_url)
-            
             response = self._get_with_retry(paper_url)
             
             # 确保正确编码
             if response.encoding == 'ISO-8859-1':
                 response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 提取论文信息
-            paper_details = {
-                'url': paper_url,
-                'crawled_at': datetime.now().isoformat()
-            }
+            return self._process_paper_details(paper_url, response.text)
             
-            # 标题
-            title_elem = soup.find('h1')
-            if title_elem:
-                paper_details['title'] = title_elem.text.strip()
-            
-            # 作者
-            authors_elem = soup.find('div', class_='authors')
-            if authors_elem:
-                paper_details['authors'] = [a.text.strip() for a in authors_elem.find_all('a')]
-            
-            # 摘要
-            abstract_elem = soup.find('div', class_='paper-abstract')
-            if abstract_elem:
-                paper_details['abstract'] = abstract_elem.text.strip()
-            
-            # 标签
-            tags = []
-            tag_elems = soup.find_all('a', class_='badge badge-secondary')
-            for tag in tag_elems:
-                tags.append(tag.text.strip())
-            paper_details['tags'] = tags
-            
-            # GitHub仓库链接
-            github_repos = self._extract_github_repos(soup)
-            paper_details['github_repos'] = github_repos
-            
-            # 代码实现列表
-            implementations = self._extract_implementations(soup)
-            paper_details['implementations'] = implementations
-            
-            # 论文链接（arxiv等）
-            paper_links = self._extract_paper_links(soup)
-            paper_details['paper_links'] = paper_links
+        except Exception as e:
+            logger.error(f"爬取论文详情失败: {e}")
+            raise
+    
+    async def crawl_paper_details_async(self, session: "aiohttp.ClientSession", paper_url: str) -> Dict[str, Any]:
+        """
+        异步爬取单篇论文的详细信息
+        
+        Args:
+            session: aiohttp会话
+            paper_url: 论文页面URL
             
-            return paper_details
+        Returns:
+            论文详细信息
+        """
+        paper_url = self._normalize_url(paper_url)
+        
+        cached = self._cache_get("details", paper_url)
+        if cached is not None:
+            logger.info(f"命中论文详情缓存: {paper_url}")
+            return cached
+        
+        logger.info(f"开始爬取论文详情: {paper_url}")
+        
+        try:
+            html_content = await self._get_text_async(session, paper_url)
+            return self._process_paper_details(paper_url, html_content)
             
         except Exception as e:
             logger.error(f"爬取论文详情失败: {e}")
             raise
     
+    def _process_paper_details(self, paper_url: str, html_content: str) -> Dict[str, Any]:
+        """解析论文详情页面并写入缓存"""
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+        
+        # 提取论文信息
+        paper_details = {
+            'url': paper_url,
+            'crawled_at': datetime.now().isoformat()
+        }
+        
+        # 标题
+        title_elem = soup.find('h1')
+        if title_elem:
+            paper_details['title'] = title_elem.text.strip()
+        
+        # 作者
+        authors_elem = soup.find('div', class_='authors')
+        if authors_elem:
+            paper_details['authors'] = [a.text.strip() for a in authors_elem.find_all('a')]
+        
+        # 摘要
+        abstract_elem = soup.find('div', class_='paper-abstract')
+        if abstract_elem:
+            paper_details['abstract'] = abstract_elem.text.strip()
+        
+        # 标签
+        tags = []
+        tag_elems = soup.find_all('a', class_='badge badge-secondary')
+        for tag in tag_elems:
+            tags.append(tag.text.strip())
+        paper_details['tags'] = tags
+        
+        # GitHub仓库链接
+        github_repos = self._extract_github_repos(soup)
+        paper_details['github_repos'] = github_repos
+        
+        # 代码实现列表
+        implementations = self._extract_implementations(soup)
+        paper_details['implementations'] = implementations
+        
+        # 论文链接（arxiv等）
+        paper_links = self._extract_paper_links(soup)
+        paper_details['paper_links'] = paper_links
+        
+        self._cache_set("details", paper_details, paper_url)
+        return paper_details
+    
     def crawl_papers_batch(self, 
                           papers: List[Dict[str, Any]], 
                           fetch_details: bool = True) -> List[Dict[str, Any]]:
@@ -361,6 +683,59 @@ class PapersWithCodeCrawler:
         
         return detailed_papers
     
+    async def crawl_papers_batch_async(self,
+                                       papers: List[Dict[str, Any]],
+                                       fetch_details: bool = True,
+                                       max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        并发批量爬取论文详情
+        
+        所有请求共享一个aiohttp会话（keep-alive连接池），并发数由信号量限制。
+        
+        Args:
+            papers: 论文列表（需包含url字段）
+            fetch_details: 是否爬取详细信息
+            max_concurrency: 最大并发数，默认为max_workers
+            
+        Returns:
+            包含详细信息的论文列表，顺序与输入一致
+        """
+        if not fetch_details:
+            return papers
+        
+        if aiohttp is None:
+            raise ImportError("请安装aiohttp包: pip install aiohttp")
+        
+        papers = [paper for paper in papers if 'url' in paper]
+        logger.info(f"开始并发爬取 {len(papers)} 篇论文的详细信息...")
+        
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_workers)
+        connector = aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        # aiohttp默认不支持br解码
+        headers = {**self.headers, 'Accept-Encoding': 'gzip, deflate'}
+        
+        async with aiohttp.ClientSession(headers=headers, connector=connector, timeout=timeout) as session:
+            async def bounded_crawl(paper: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.crawl_paper_details_async(session, paper['url'])
+            
+            results = await asyncio.gather(
+                *[bounded_crawl(paper) for paper in papers],
+                return_exceptions=True
+            )
+        
+        detailed_papers = []
+        for paper, details in zip(papers, results):
+            if isinstance(details, Exception):
+                logger.error(f"爬取论文详情失败: {details}")
+            else:
+                # 合并基本信息和详细信息
+                paper.update(details)
+            detailed_papers.append(paper)
+        
+        return detailed_papers
+    
     def search_papers(self, query: str, top_k: int = 10) -> List[Dict[str, Any]]:
         """
         搜索论文
@@ -372,6 +747,11 @@ class PapersWithCodeCrawler:
         Returns:
             论文列表
         """
+        cached = self._cache_get("search", query, top_k)
+        if cached is not None:
+            logger.info(f"命中搜索缓存: {query}")
+            return cached
+        
         logger.info(f"搜索论文: {query}")
         
         # 构建搜索URL
@@ -397,7 +777,7 @@ class PapersWithCodeCrawler:
             if response.encoding == 'ISO-8859-1':
                 response.encoding = 'utf-8'
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # 调试信息：页面结构分析
             logger.info(f"🔍 页面标题: {soup.title.string if soup.title else 'No title'}")
@@ -467,7 +847,7 @@ class PapersWithCodeCrawler:
                 for div in all_divs:
                     classes = div.get('class', [])
                     for cls in classes:
-                        if 'paper' in cls.lower() or 'item' in cls.lower() or 'result' in cls.lower():
+                        if PAPER_CLASS_PATTERN.search(cls):
                             paper_classes.add(cls)
                 
                 if paper_classes:
@@ -476,14 +856,9 @@ class PapersWithCodeCrawler:
                     logger.warning("🔍 未发现明显的论文相关类名")
                 
                 # 查看是否有搜索结果提示
-                no_results_indicators = [
-                    'no results', 'no papers', 'not found', '0 results', 'nothing found'
-                ]
-                page_text = soup.get_text().lower()
-                for indicator in no_results_indicators:
-                    if indicator in page_text:
-                        logger.warning(f"🔍 页面可能显示无结果: 发现文本 '{indicator}'")
-                        break
+                match = NO_RESULTS_PATTERN.search(soup.get_text())
+                if match:
+                    logger.warning(f"🔍 页面可能显示无结果: 发现文本 '{match.group(0).lower()}'")
             
             # 只处理前 top_k 个结果
             paper_items = paper_items[:top_k]
@@ -501,12 +876,102 @@ class PapersWithCodeCrawler:
             self._save_paper_list(f"search_{query}", papers)
             
             logger.info(f"🎉 搜索完成，成功解析 {len(papers)} 篇论文")
+            if papers:
+                self._cache_set("search", papers, query, top_k)
             return papers
             
         except Exception as e:
             logger.error(f"搜索论文失败: {e}")
             raise
     
+    def search_papers_batch(self,
+                            terms: List[str],
+                            top_k: int = 10,
+                            stop_on_first: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        批量搜索论文：多个搜索词用OR合并为一次请求，再按词拆分结果
+        
+        结果中标题或任务包含某搜索词全部词元的论文归入该词；
+        合并请求失败或某个词未分到结果时，对这些词并发单独调用search_papers，
+        单独搜索失败的词返回空列表。
+        
+        Args:
+            terms: 搜索关键词列表
+            top_k: 每个搜索词返回结果数量
+            stop_on_first: 只需要按terms顺序第一个有结果的词时设为True，
+                一旦确定该词即返回，排在其后的词不再搜索，未开始的单独搜索被取消
+            
+        Returns:
+            {搜索词: 论文列表}，顺序与terms一致；stop_on_first时只包含已确定结果的词
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        unique_terms = list(dict.fromkeys(terms))
+        
+        def first_hit_found() -> bool:
+            """按顺序检查：遇到未确定的词返回False，遇到有结果的词返回True"""
+            for term in unique_terms:
+                if term not in results:
+                    return False
+                if results[term]:
+                    return True
+            return False
+        
+        for start in range(0, len(unique_terms), self.SEARCH_BATCH_SIZE):
+            chunk = unique_terms[start:start + self.SEARCH_BATCH_SIZE]
+            if len(chunk) > 1:
+                try:
+                    papers = self.search_papers(" OR ".join(chunk), top_k=top_k * len(chunk))
+                except Exception as e:
+                    logger.warning(f"合并搜索失败，改为逐个搜索: {e}")
+                    papers = []
+                
+                for term in chunk:
+                    tokens = term.lower().split()
+                    matched = []
+                    for paper in papers:
+                        text = " ".join([paper.get('title', ''), *paper.get('tasks', [])]).lower()
+                        if all(token in text for token in tokens):
+                            matched.append(paper)
+                            if len(matched) >= top_k:
+                                break
+                    if matched:
+                        results[term] = matched
+            
+            # 未分到结果的词并发单独搜索；只需第一个结果时，排在首个命中词之后的词无需搜索
+            missing = []
+            for term in chunk:
+                if stop_on_first and results.get(term):
+                    break
+                if term not in results:
+                    missing.append(term)
+            
+            if missing:
+                executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing)))
+                futures = {}
+                try:
+                    futures = {executor.submit(self.search_papers, term, top_k): term for term in missing}
+                    for future in as_completed(futures):
+                        term = futures[future]
+                        try:
+                            results[term] = future.result()
+                        except Exception as e:
+                            logger.error(f"搜索 '{term}' 失败: {e}")
+                            results[term] = []
+                        if stop_on_first and first_hit_found():
+                            break
+                finally:
+                    # 提前结束时不等待仍在进行的请求，并取消尚未开始的搜索
+                    # （shutdown的cancel_futures参数需要Python 3.9+，这里手动取消）
+                    if stop_on_first:
+                        for future in futures:
+                            future.cancel()
+                    executor.shutdown(wait=not stop_on_first)
+            
+            if stop_on_first and first_hit_found():
+                break
+        
+        return {term: results[term] for term in unique_terms if term in results}
+    
     def _parse_paper_item(self, item) -> Optional[Dict[str, Any]]:
         """解析论文列表项"""
         try:
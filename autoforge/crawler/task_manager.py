@@ -4,11 +4,77 @@ HuggingFace任务类型管理器
 
 import yaml
 import logging
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Set
 
 logger = logging.getLogger(__name__)
 
+# 安装了libyaml时使用C实现的加载器，解析速度快一个数量级
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "data" / "hf_tasks.yaml"
+
+
+@functools.lru_cache(maxsize=8)
+def _load_catalog(config_path: str, mtime: float) -> Dict[str, Any]:
+    """
+    加载任务配置并构建索引，按(路径, 修改时间)缓存，同一配置只解析一次
+    
+    Args:
+        config_path: 配置文件路径
+        mtime: 配置文件修改时间，文件变更后缓存自动失效
+        
+    Returns:
+        任务、排序选项及各类索引，均为只读视图（缓存结果在所有实例间共享）
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=YAML_LOADER)
+    
+    tasks: Dict[str, Dict[str, Any]] = {}
+    sort_options: Dict[str, Dict[str, Any]] = {}
+    
+    # 解析任务类型
+    for category, items in config.items():
+        if category == 'sort_options':
+            # 解析排序选项
+            sort_options = {opt['value']: opt for opt in items}
+        else:
+            # 解析任务类型
+            for task in items:
+                task['category'] = category
+                tasks[task['tag']] = task
+    
+    logger.info(f"加载了 {len(tasks)} 个任务类型，{len(sort_options)} 个排序选项")
+    
+    # 构建类别索引和搜索用的二元组倒排索引，避免每次查询都遍历全部任务
+    by_category: Dict[str, List[str]] = {}
+    task_order: Dict[str, int] = {}
+    bigram_index: Dict[str, Set[str]] = {}
+    # 名称、标签、描述预先转小写并用\x00拼接（关键词不会跨字段匹配），查询时只需一次子串查找
+    search_texts: Dict[str, str] = {}
+    
+    for position, (tag, task) in enumerate(tasks.items()):
+        by_category.setdefault(task['category'], []).append(tag)
+        task_order[tag] = position
+        
+        fields = [field.lower() for field in (task['name'], task['tag'], task.get('description', ''))]
+        search_texts[tag] = '\x00'.join(fields)
+        for text in fields:
+            for i in range(len(text) - 1):
+                bigram_index.setdefault(text[i:i + 2], set()).add(tag)
+    
+    return {
+        'tasks': MappingProxyType({tag: MappingProxyType(task) for tag, task in tasks.items()}),
+        'sort_options': MappingProxyType({value: MappingProxyType(opt) for value, opt in sort_options.items()}),
+        'by_category': MappingProxyType({category: tuple(tags) for category, tags in by_category.items()}),
+        'task_order': MappingProxyType(task_order),
+        'bigram_index': MappingProxyType({bigram: frozenset(tags) for bigram, tags in bigram_index.items()}),
+        'search_texts': MappingProxyType(search_texts),
+        'categories': tuple(sorted(by_category)),
+    }
+
 
 class TaskManager:
     """任务类型管理器"""
@@ -17,38 +83,29 @@ class TaskManager:
         """
         初始化任务管理器
         
+        同一配置文件的解析结果和索引在进程内共享，重复创建实例不再重新加载；
+        任务和排序选项按实例复制，修改不会影响其他实例。
+        
         Args:
             config_path: 配置文件路径，默认使用内置配置
         """
         if config_path is None:
             # 使用默认配置文件
-            config_path = Path(__file__).parent.parent / "data" / "hf_tasks.yaml"
+            config_path = DEFAULT_CONFIG_PATH
         
         self.config_path = Path(config_path)
-        self.tasks = {}
-        self.sort_options = {}
-        self._load_config()
-    
-    def _load_config(self):
-        """加载配置文件"""
         if not self.config_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {self.config_path}")
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        
-        # 解析任务类型
-        for category, tasks in config.items():
-            if category == 'sort_options':
-                # 解析排序选项
-                self.sort_options = {opt['value']: opt for opt in tasks}
-            else:
-                # 解析任务类型
-                for task in tasks:
-                    task['category'] = category
-                    self.tasks[task['tag']] = task
-        
-        logger.info(f"加载了 {len(self.tasks)} 个任务类型，{len(self.sort_options)} 个排序选项")
+        catalog = _load_catalog(str(self.config_path.resolve()), self.config_path.stat().st_mtime)
+        self.tasks = {tag: dict(task) for tag, task in catalog['tasks'].items()}
+        self.sort_options = {value: dict(opt) for value, opt in catalog['sort_options'].items()}
+        self._by_category = catalog['by_category']
+        self._task_order = catalog['task_order']
+        self._bigram_index = catalog['bigram_index']
+        self._search_texts = catalog['search_texts']
+        self._categories = catalog['categories']
+        self._formatted_task_list: Optional[str] = None
     
     def get_task_by_tag(self, tag: str) -> Optional[Dict[str, Any]]:
         """
@@ -72,7 +129,7 @@ class TaskManager:
         Returns:
             任务列表
         """
-        return [task for task in self.tasks.values() if task['category'] == category]
+        return [self.tasks[tag] for tag in self._by_category.get(category, ()) if tag in self.tasks]
     
     def get_all_tasks(self) -> Dict[str, Dict[str, Any]]:
         """获取所有任务"""
@@ -80,10 +137,7 @@ class TaskManager:
     
     def get_all_categories(self) -> List[str]:
         """获取所有任务类别"""
-        categories = set()
-        for task in self.tasks.values():
-            categories.add(task['category'])
-        return sorted(list(categories))
+        return list(self._categories)
     
     def get_sort_options(self) -> Dict[str, Dict[str, Any]]:
         """获取所有排序选项"""
@@ -100,18 +154,23 @@ class TaskManager:
             匹配的任务列表
         """
         keyword = keyword.lower()
-        results = []
         
-        for task in self.tasks.values():
-            if (keyword in task['name'].lower() or 
-                keyword in task['tag'].lower() or 
-                keyword in task.get('description', '').lower()):
-                results.append(task)
+        # 关键词的每个二元组都必须出现在任务文本中，先用倒排索引缩小候选范围
+        if len(keyword) >= 2:
+            bigrams = [keyword[i:i + 2] for i in range(len(keyword) - 1)]
+            candidates = frozenset.intersection(*(self._bigram_index.get(bigram, frozenset()) for bigram in bigrams))
+            tags = sorted(candidates, key=self._task_order.__getitem__)
+        else:
+            tags = self.tasks
         
-        return results
+        search_texts = self._search_texts
+        return [self.tasks[tag] for tag in tags if tag in self.tasks and keyword in search_texts.get(tag, '')]
     
     def format_task_list(self) -> str:
         """格式化输出所有任务类型"""
+        if self._formatted_task_list is not None:
+            return self._formatted_task_list
+        
         output = []
         
         for category in self.get_all_categories():
@@ -129,4 +188,5 @@ class TaskManager:
             if opt.get('description'):
                 output.append(f"    {opt['description']}")
         
-        return "\n".join(output) 
\ No newline at end of file
+        self._formatted_task_list = "\n".join(output)
+        return self._formatted_task_list 
\ No newline at end of file
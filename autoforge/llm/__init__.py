@@ -2,9 +2,9 @@
 LLM客户端模块
 """
 
-from .base import BaseLLMClient
+from .base import BaseLLMClient, get_shared_http_client
 from .openai_client import OpenAIClient
 from .deepseek_client import DeepSeekClient
 from .bailian_client import BaiLianClient
 
-__all__ = ["BaseLLMClient", "OpenAIClient", "DeepSeekClient", "BaiLianClient"] 
\ No newline at end of file
+__all__ = ["BaseLLMClient", "get_shared_http_client", "OpenAIClient", "DeepSeekClient", "BaiLianClient"] 
\ No newline at end of file
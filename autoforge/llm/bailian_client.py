@@ -4,10 +4,14 @@
 """
 
 import os
+import json
+import time
+import hashlib
 from loguru import logger
 from typing import Optional, Dict, Any, List, Union, Iterator
 import base64
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from .base import BaseLLMClient
 
@@ -40,11 +44,20 @@ class BaiLianClient(BaseLLMClient):
     # 多模态模型
     MULTIMODAL_MODELS = ["qwen-vl-plus", "qwen-vl-max"]
     
+    # 响应缓存版本，请求或响应处理逻辑变化时递增，使旧缓存全部失效
+    RESPONSE_CACHE_VERSION = 2
+    
+    # 响应缓存默认有效期（秒）
+    RESPONSE_CACHE_TTL = 7 * 24 * 3600
+    
     def __init__(self,
                  api_key: Optional[str] = None,
                  base_url: str = "https://dashscope.aliyuncs.com/compatible-mode/v1",
                  model: str = "qwen-plus",
-                 organization: Optional[str] = None):
+                 organization: Optional[str] = None,
+                 http_client: Optional[Any] = None,
+                 cache_dir: Optional[str] = None,
+                 cache_ttl: Optional[float] = RESPONSE_CACHE_TTL):
         """
         初始化百炼客户端
         
@@ -53,6 +66,9 @@ class BaiLianClient(BaseLLMClient):
             base_url: API基础URL，默认为百炼的兼容模式API地址
             model: 使用的模型名称
             organization: 组织ID
+            http_client: 自定义httpx.Client（可选），传入get_shared_http_client()可跨客户端复用连接池
+            cache_dir: 响应缓存目录（可选），设置后相同请求的非流式响应直接从磁盘读取
+            cache_ttl: 响应缓存有效期（秒），None表示永不过期
         """
         if openai is None:
             raise ImportError("请安装openai包: pip install openai")
@@ -65,10 +81,16 @@ class BaiLianClient(BaseLLMClient):
         self.client = openai.OpenAI(
             api_key=self.api_key,
             base_url=base_url,
-            organization=organization
+            organization=organization,
+            http_client=http_client
         )
         self.model = model
         
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
         logger.info(f"百炼客户端已初始化，使用模型: {self.model}")
     
     def _is_thinking_model(self, model: Optional[str] = None) -> bool:
@@ -182,6 +204,7 @@ class BaiLianClient(BaseLLMClient):
                            image_paths: List[str],
                            prompt: str = "请详细描述这些图片的内容，包括文字、图表、关键信息等。",
                            model: Optional[str] = None,
+                           max_workers: int = 4,
                            **kwargs) -> List[str]:
         """
         批量分析多张图片
@@ -190,21 +213,25 @@ class BaiLianClient(BaseLLMClient):
             image_paths: 图片文件路径列表
             prompt: 分析提示词
             model: 使用的模型
+            max_workers: 并发请求数，为1时逐张分析
             **kwargs: 其他参数
             
         Returns:
-            图片分析结果列表
+            图片分析结果列表，顺序与image_paths一致
         """
-        results = []
-        for image_path in image_paths:
+        def analyze(image_path: str) -> str:
             try:
-                result = self.analyze_image(image_path, prompt, model, **kwargs)
-                results.append(result)
+                return self.analyze_image(image_path, prompt, model, **kwargs)
             except Exception as e:
                 logger.error(f"分析图片 {image_path} 失败: {e}")
-                results.append(f"分析失败: {str(e)}")
+                return f"分析失败: {str(e)}"
+        
+        if max_workers <= 1 or len(image_paths) <= 1:
+            return [analyze(image_path) for image_path in image_paths]
         
-        return results
+        # 各图片的请求互不依赖，并发发送以重叠网络等待
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(image_paths))) as executor:
+            return list(executor.map(analyze, image_paths))
     
     def generate(self, 
                 prompt: str,
@@ -256,11 +283,14 @@ class BaiLianClient(BaseLLMClient):
                 - enable_search: 是否启用联网搜索
                 - search_options: 搜索选项
                 - stream_options: 流式选项
+                - use_cache: 是否使用响应缓存（默认True），仅在设置了cache_dir时生效
             
         Returns:
             生成的文本或流式迭代器
         """
         try:
+            use_cache = kwargs.pop("use_cache", True)
+            
             # 提取需要放入extra_body的参数
             extra_body = kwargs.pop("extra_body", {})
             
@@ -335,6 +365,16 @@ class BaiLianClient(BaseLLMClient):
                 return self._handle_stream_response(stream_response)
             else:
                 # 非流式输出
+                cache_file = self._response_cache_file(request_params) if use_cache else None
+                if cache_file and self._response_cache_fresh(cache_file):
+                    try:
+                        with open(cache_file, 'r', encoding='utf-8') as f:
+                            content = json.load(f)["content"]
+                        logger.info(f"[百炼响应] 命中缓存: {cache_file.name}")
+                        return content
+                    except (OSError, ValueError, KeyError) as e:
+                        logger.warning(f"读取响应缓存失败: {e}")
+                
                 response = self.client.chat.completions.create(**request_params)
                 
                 # 提取内容
@@ -347,12 +387,67 @@ class BaiLianClient(BaseLLMClient):
                 if hasattr(response, 'usage'):
                     logger.debug(f"Token使用: {response.usage}")
                 
+                if cache_file and content is not None:
+                    try:
+                        with open(cache_file, 'w', encoding='utf-8') as f:
+                            json.dump({"model": model, "content": content}, f, ensure_ascii=False)
+                    except OSError as e:
+                        logger.warning(f"写入响应缓存失败: {e}")
+                
                 return content
             
         except Exception as e:
             logger.error(f"百炼 API调用失败: {e}")
             raise
     
+    def stream_with_messages(self,
+                             messages: List[Dict[str, str]],
+                             temperature: float = 0.7,
+                             max_tokens: int = 4000,
+                             **kwargs) -> Iterator[str]:
+        """
+        使用消息格式流式生成响应
+        
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数，同generate_with_messages
+            
+        Returns:
+            逐段产出文本的迭代器
+        """
+        return self.generate_with_messages(messages, temperature, max_tokens, stream=True, **kwargs)
+    
+    def _probe_connection(self) -> str:
+        """发送连接验证请求，不使用响应缓存"""
+        return self.generate("Hello, please respond with 'OK'.", temperature=0, use_cache=False)
+    
+    def _response_cache_file(self, request_params: Dict[str, Any]) -> Optional[Path]:
+        """
+        根据请求参数计算响应缓存文件路径，未启用缓存时返回None
+        
+        缓存键包含API地址和API密钥摘要，更换密钥或服务地址后不会复用旧响应。
+        """
+        if not self.cache_dir:
+            return None
+        raw = json.dumps([
+            self.RESPONSE_CACHE_VERSION,
+            str(self.client.base_url),
+            hashlib.sha256(self.api_key.encode('utf-8')).hexdigest(),
+            request_params
+        ], ensure_ascii=False, sort_keys=True, default=str)
+        digest = hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"bailian_{digest}.json"
+    
+    def _response_cache_fresh(self, cache_file: Path) -> bool:
+        """缓存文件是否存在且在有效期内"""
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+        except OSError:
+            return False
+        return self.cache_ttl is None or 0 <= age < self.cache_ttl
+    
     def _handle_stream_response(self, stream_response) -> Iterator[str]:
         """处理流式响应"""
         try:
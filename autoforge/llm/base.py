@@ -3,11 +3,63 @@ LLM客户端基类
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
+import asyncio
+import atexit
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import threading
+import time
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 延迟导入，避免依赖问题
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_SHARED_HTTP = None
+_SHARED_HTTP_LOCK = threading.Lock()
+
+# 连接验证结果缓存：{缓存键: 验证成功的时间戳}，带API密钥的客户端同时持久化到磁盘供其他进程复用
+VALIDATION_TTL = 600
+VALIDATION_CACHE_MAX_AGE = 24 * 3600  # 磁盘缓存中超过该时长的记录会被清理
+VALIDATION_CACHE_FILE = Path(os.path.expanduser("~/.cache/autoforge/validated.json"))
+_VALIDATED: Optional[Dict[str, float]] = None
+_VALIDATED_LOCK = threading.Lock()
+
+
+def get_shared_http_client():
+    """
+    获取进程内共享的HTTP客户端
+    
+    各LLM客户端传入同一个httpx.Client后可复用连接池与TLS会话，
+    避免每个客户端实例、每次调用都重新握手。进程退出时自动关闭。
+    
+    Returns:
+        共享的httpx.Client实例
+    """
+    global _SHARED_HTTP
+    if httpx is None:
+        raise ImportError("请安装httpx包: pip install httpx")
+    
+    with _SHARED_HTTP_LOCK:
+        if _SHARED_HTTP is None:
+            _SHARED_HTTP = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=httpx.Timeout(600.0, connect=30.0),
+                follow_redirects=True
+            )
+            atexit.register(_SHARED_HTTP.close)
+    return _SHARED_HTTP
+
 
 class BaseLLMClient(ABC):
     """LLM客户端基类"""
@@ -52,16 +104,219 @@ class BaseLLMClient(ABC):
         """
         pass
     
-    def validate_connection(self) -> bool:
+    def stream(self,
+               prompt: str,
+               temperature: float = 0.7,
+               max_tokens: int = 4000,
+               **kwargs) -> Iterator[str]:
+        """
+        流式生成响应
+        
+        Args:
+            prompt: 提示词
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数
+            
+        Returns:
+            逐段产出文本的迭代器
+        """
+        messages = [{"role": "user", "content": prompt}]
+        return self.stream_with_messages(messages, temperature, max_tokens, **kwargs)
+    
+    def stream_with_messages(self,
+                             messages: List[Dict[str, str]],
+                             temperature: float = 0.7,
+                             max_tokens: int = 4000,
+                             **kwargs) -> Iterator[str]:
+        """
+        使用消息格式流式生成响应
+        
+        默认实现一次性产出完整响应，支持流式接口的客户端应覆盖此方法。
+        
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数
+            
+        Returns:
+            逐段产出文本的迭代器
+        """
+        yield self.generate_with_messages(messages, temperature, max_tokens, **kwargs)
+    
+    async def agenerate(self,
+                        prompt: str,
+                        temperature: float = 0.7,
+                        max_tokens: int = 4000,
+                        **kwargs) -> str:
+        """
+        异步生成响应
+        
+        Args:
+            prompt: 提示词
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数
+            
+        Returns:
+            生成的文本
+        """
+        messages = [{"role": "user", "content": prompt}]
+        return await self.agenerate_with_messages(messages, temperature, max_tokens, **kwargs)
+    
+    async def agenerate_with_messages(self,
+                                      messages: List[Dict[str, str]],
+                                      temperature: float = 0.7,
+                                      max_tokens: int = 4000,
+                                      **kwargs) -> str:
+        """
+        使用消息格式异步生成响应
+        
+        默认实现在线程中调用同步接口（等待网络时释放GIL），支持原生异步接口的客户端可覆盖此方法。
+        
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数
+            
+        Returns:
+            生成的文本
+        """
+        # asyncio.to_thread需要Python 3.9+，这里直接使用默认线程池
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.generate_with_messages, messages, temperature, max_tokens, **kwargs)
+        )
+    
+    async def agenerate_batch(self,
+                              prompts: List[str],
+                              temperature: float = 0.7,
+                              max_tokens: int = 4000,
+                              max_concurrency: int = 8,
+                              **kwargs) -> List[str]:
+        """
+        并发处理多个互不依赖的提示词
+        
+        Args:
+            prompts: 提示词列表
+            temperature: 生成温度
+            max_tokens: 最大token数
+            max_concurrency: 最大并发请求数
+            **kwargs: 其他参数
+            
+        Returns:
+            与prompts顺序一致的响应列表
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def bounded_generate(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt, temperature, max_tokens, **kwargs)
+        
+        return await asyncio.gather(*[bounded_generate(prompt) for prompt in prompts])
+    
+    def validate_connection(self, use_cache: bool = True, ttl: Optional[float] = None) -> bool:
         """
         验证连接是否正常
         
+        验证成功的结果在有效期内缓存，同一进程内（以及共享同一API密钥的
+        其他进程）的重复验证不再发起请求。
+        
+        Args:
+            use_cache: 是否使用已缓存的验证结果
+            ttl: 缓存有效期（秒），默认为VALIDATION_TTL
+            
         Returns:
             连接是否正常
         """
+        key, persist = self._validation_cache_key()
+        if use_cache and _validation_cached(key, VALIDATION_TTL if ttl is None else ttl):
+            logger.debug("连接验证命中缓存")
+            return True
+        
         try:
-            response = self.generate("Hello, please respond with 'OK'.", temperature=0)
-            return "OK" in response or "ok" in response.lower()
+            response = self._probe_connection()
+            is_valid = "OK" in response or "ok" in response.lower()
         except Exception as e:
             logger.error(f"连接验证失败: {e}")
-            return False 
\ No newline at end of file
+            return False
+        
+        if is_valid:
+            _remember_validation(key, persist)
+        return is_valid
+    
+    def _probe_connection(self) -> str:
+        """
+        发送连接验证请求，子类有响应缓存时需重写以绕过缓存
+        
+        Returns:
+            模型的响应文本
+        """
+        return self.generate("Hello, please respond with 'OK'.", temperature=0)
+    
+    def _validation_cache_key(self):
+        """连接验证的缓存键：客户端类型、模型、API地址和API密钥摘要，以及是否可持久化"""
+        api_key = getattr(self, "api_key", None)
+        client = getattr(self, "client", None)
+        raw = json.dumps([
+            type(self).__name__,
+            getattr(self, "model", None),
+            str(getattr(client, "base_url", "")),
+            hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else None,
+        ])
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest(), bool(api_key)
+
+
+def _read_validation_file() -> Dict[str, float]:
+    """读取磁盘上的验证缓存文件，文件不存在或损坏时返回空字典"""
+    try:
+        with open(VALIDATION_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _load_validations() -> Dict[str, float]:
+    """加载验证缓存（首次调用时读取磁盘文件），调用方需持有_VALIDATED_LOCK"""
+    global _VALIDATED
+    if _VALIDATED is None:
+        _VALIDATED = _read_validation_file()
+    return _VALIDATED
+
+
+def _validation_cached(key: str, ttl: float) -> bool:
+    """验证结果是否仍在有效期内，内存中未命中时重新读取磁盘文件以获取其他进程的记录"""
+    now = time.time()
+    with _VALIDATED_LOCK:
+        validations = _load_validations()
+        validated_at = validations.get(key)
+        if validated_at is None or not 0 <= now - validated_at < ttl:
+            on_disk = _read_validation_file().get(key)
+            if on_disk is not None and (validated_at is None or on_disk > validated_at):
+                validations[key] = validated_at = on_disk
+    return validated_at is not None and 0 <= now - validated_at < ttl
+
+
+def _remember_validation(key: str, persist: bool):
+    """记录验证成功，persist为True时写入磁盘缓存"""
+    with _VALIDATED_LOCK:
+        validations = _load_validations()
+        now = time.time()
+        validations[key] = now
+        if not persist:
+            return
+        try:
+            VALIDATION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            # 其他进程可能已写入新的记录，合并后再保存
+            on_disk = _read_validation_file()
+            on_disk[key] = validations[key]
+            on_disk = {k: v for k, v in on_disk.items() if 0 <= now - v < VALIDATION_CACHE_MAX_AGE}
+            tmp_file = VALIDATION_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(on_disk, f)
+            os.replace(tmp_file, VALIDATION_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"保存连接验证缓存失败: {e}")
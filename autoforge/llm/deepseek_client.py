@@ -4,7 +4,7 @@ DeepSeek客户端实现
 
 import os
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator
 
 from .base import BaseLLMClient
 
@@ -24,7 +24,8 @@ class DeepSeekClient(BaseLLMClient):
                  api_key: Optional[str] = None,
                  base_url: str = "https://api.deepseek.com",
                  model: str = "deepseek-chat",
-                 organization: Optional[str] = None):
+                 organization: Optional[str] = None,
+                 http_client: Optional[Any] = None):
         """
         初始化DeepSeek客户端
         
@@ -33,6 +34,7 @@ class DeepSeekClient(BaseLLMClient):
             base_url: API基础URL，默认为DeepSeek的API地址
             model: 使用的模型名称
             organization: 组织ID
+            http_client: 自定义httpx.Client（可选），传入get_shared_http_client()可跨客户端复用连接池
         """
         if openai is None:
             raise ImportError("请安装openai包: pip install openai")
@@ -44,7 +46,8 @@ class DeepSeekClient(BaseLLMClient):
         self.client = openai.OpenAI(
             api_key=self.api_key,
             base_url=base_url,
-            organization=organization
+            organization=organization,
+            http_client=http_client
         )
         self.model = model
         
@@ -107,6 +110,41 @@ class DeepSeekClient(BaseLLMClient):
             logger.error(f"DeepSeek API调用失败: {e}")
             raise
     
+    def stream_with_messages(self,
+                             messages: List[Dict[str, str]],
+                             temperature: float = 0.7,
+                             max_tokens: int = 4000,
+                             **kwargs) -> Iterator[str]:
+        """
+        使用消息格式流式生成响应
+        
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数
+            
+        Returns:
+            逐段产出文本的迭代器
+        """
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+            
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            
+        except Exception as e:
+            logger.error(f"DeepSeek API流式调用失败: {e}")
+            raise
+    
     def set_model(self, model: str):
         """设置使用的模型"""
         self.model = model
@@ -3,8 +3,9 @@ OpenAI客户端实现
 """
 
 import os
+import json
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterator, Tuple
 
 from .base import BaseLLMClient
 
@@ -16,6 +17,11 @@ try:
 except ImportError:
     openai = None
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 
 class OpenAIClient(BaseLLMClient):
     """OpenAI API客户端"""
@@ -24,7 +30,8 @@ class OpenAIClient(BaseLLMClient):
                  api_key: Optional[str] = None,
                  base_url: Optional[str] = None,
                  model: str = "gpt-4",
-                 organization: Optional[str] = None):
+                 organization: Optional[str] = None,
+                 http_client: Optional[Any] = None):
         """
         初始化OpenAI客户端
         
@@ -33,6 +40,7 @@ class OpenAIClient(BaseLLMClient):
             base_url: API基础URL，用于自定义端点
             model: 使用的模型名称
             organization: 组织ID
+            http_client: 自定义httpx.Client（可选），传入get_shared_http_client()可跨客户端复用连接池
         """
         if openai is None:
             raise ImportError("请安装openai包: pip install openai")
@@ -44,7 +52,8 @@ class OpenAIClient(BaseLLMClient):
         self.client = openai.OpenAI(
             api_key=self.api_key,
             base_url=base_url,
-            organization=organization
+            organization=organization,
+            http_client=http_client
         )
         self.model = model
         
@@ -102,6 +111,151 @@ class OpenAIClient(BaseLLMClient):
             logger.error(f"OpenAI API调用失败: {e}")
             raise
     
+    def stream_with_messages(self,
+                             messages: List[Dict[str, str]],
+                             temperature: float = 0.7,
+                             max_tokens: int = 4000,
+                             **kwargs) -> Iterator[str]:
+        """
+        使用消息格式流式生成响应
+        
+        Args:
+            messages: 消息列表
+            temperature: 生成温度
+            max_tokens: 最大token数
+            **kwargs: 其他参数
+            
+        Returns:
+            逐段产出文本的迭代器
+        """
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+            
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            
+        except Exception as e:
+            logger.error(f"OpenAI API流式调用失败: {e}")
+            raise
+    
+    def generate_multi(self,
+                       prompts: List[str],
+                       system: str,
+                       temperature: float = 0.7,
+                       max_tokens: int = 4000,
+                       max_input_tokens: int = 6000,
+                       **kwargs) -> List[Any]:
+        """
+        共享同一系统提示词批量处理多个条目
+        
+        将多个条目合并为一个编号列表在单次请求中发送，系统提示词只需预填充一次；
+        输入超出token预算时自动拆分为多次请求。
+        
+        Args:
+            prompts: 条目列表
+            system: 共享的系统提示词
+            temperature: 生成温度
+            max_tokens: 最大token数
+            max_input_tokens: 单次请求的输入token预算
+            **kwargs: 其他参数
+            
+        Returns:
+            与prompts顺序一致的结果列表，模型未返回的条目为None
+        """
+        results = {}
+        
+        for batch in self._split_multi_batches(prompts, system, max_input_tokens):
+            items_text = "\n".join(f"{item_id}. {prompt}" for item_id, prompt in batch)
+            messages = [
+                {"role": "system", "content": system},
+                {"role": "user", "content": (
+                    f"Process items:\n{items_text}\n\n"
+                    '请以JSON格式返回每个条目的处理结果，格式为: '
+                    '{"items": [{"id": 条目编号, "result": 处理结果}, ...]}'
+                )}
+            ]
+            
+            response = self.generate_with_messages(
+                messages,
+                temperature,
+                max_tokens,
+                response_format={"type": "json_object"},
+                **kwargs
+            )
+            
+            # 模型未返回内容时，本批次的条目均按未返回处理
+            if not response:
+                logger.warning(f"批量请求未返回内容，{len(batch)} 个条目无结果")
+                continue
+            
+            try:
+                items = json.loads(response).get("items", [])
+            except (json.JSONDecodeError, AttributeError) as e:
+                logger.error(f"批量结果JSON解析失败: {e}")
+                raise
+            
+            for item in items:
+                if not isinstance(item, dict) or "id" not in item:
+                    continue
+                # 编号由模型生成，无法解析或超出范围的条目跳过，对应位置返回None
+                try:
+                    item_id = int(item["id"])
+                except (TypeError, ValueError):
+                    item_id = None
+                if item_id is None or not 1 <= item_id <= len(prompts):
+                    logger.warning(f"忽略编号无效的批量结果: {item['id']!r}")
+                    continue
+                results[item_id] = item.get("result")
+        
+        return [results.get(item_id) for item_id in range(1, len(prompts) + 1)]
+    
+    def _split_multi_batches(self,
+                             prompts: List[str],
+                             system: str,
+                             max_input_tokens: int) -> List[List[Tuple[int, str]]]:
+        """按token预算将条目拆分为多个批次，编号在所有批次间全局唯一"""
+        batches = []
+        current = []
+        budget = max_input_tokens - self._estimate_tokens(system)
+        used = 0
+        
+        for item_id, prompt in enumerate(prompts, 1):
+            cost = self._estimate_tokens(f"{item_id}. {prompt}\n")
+            if current and used + cost > budget:
+                batches.append(current)
+                current = []
+                used = 0
+            current.append((item_id, prompt))
+            used += cost
+        
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _estimate_tokens(self, text: str) -> int:
+        """估算文本的token数"""
+        if not hasattr(self, "_encoding"):
+            self._encoding = None
+            if tiktoken is not None:
+                try:
+                    self._encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception as e:
+                    logger.warning(f"加载tiktoken编码失败，改用字符数估算: {e}")
+        
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        # 简单估计：每个字符约0.5个token
+        return len(text) // 2 + 1
+    
     def set_model(self, model: str):
         """设置使用的模型"""
         self.model = model
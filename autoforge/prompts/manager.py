@@ -5,10 +5,10 @@
 import re
 from typing import Dict, Any, Optional
 from pathlib import Path
-import json
 import logging
 
 from .templates import PromptTemplates
+from ..utils import json_loads, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +41,8 @@ class PromptManager:
         json_files = prompts_path.glob("*.json")
         for json_file in json_files:
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    prompts_data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    prompts_data = json_loads(f.read())
                     self.custom_prompts.update(prompts_data)
                 logger.info(f"加载自定义提示词: {json_file}")
             except Exception as e:
@@ -129,6 +129,26 @@ class PromptManager:
         self.custom_prompts[name] = content
         logger.info(f"保存自定义提示词: {file_path}")
     
+    def save_custom_prompts_bundle(self, name: str, prompts: Dict[str, str], prompts_dir: str):
+        """
+        将多个自定义提示词保存为一个JSON文件
+        
+        Args:
+            name: 文件名（不含扩展名）
+            prompts: 提示词名称到内容的映射
+            prompts_dir: 保存目录
+        """
+        prompts_path = Path(prompts_dir)
+        prompts_path.mkdir(parents=True, exist_ok=True)
+        
+        file_path = prompts_path / f"{name}.json"
+        with open(file_path, 'wb') as f:
+            f.write(json_dumps(prompts, indent=True))
+        
+        # 更新内存中的提示词
+        self.custom_prompts.update(prompts)
+        logger.info(f"保存自定义提示词集合: {file_path}")
+    
     def list_prompts(self) -> Dict[str, str]:
         """
         列出所有可用的提示词
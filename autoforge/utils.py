@@ -0,0 +1,65 @@
+"""
+通用工具函数
+"""
+
+import json
+import datetime
+from typing import Any
+
+# 优先使用orjson加速JSON读写，未安装时回退到标准库
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    解析UTF-8编码的JSON数据
+    
+    Args:
+        data: JSON数据
+        
+    Returns:
+        解析得到的对象
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj: Any) -> Any:
+    """标准库序列化的兜底处理，与orjson一致地将日期时间编码为ISO 8601字符串"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    将对象序列化为UTF-8 JSON数据
+    
+    orjson与标准库两种实现接受相同的输入：非字符串的字典键转为字符串，
+    日期时间转为ISO 8601字符串。
+    
+    Args:
+        obj: JSON可序列化的对象
+        indent: 是否以2个空格缩进（便于阅读），否则输出紧凑格式
+        
+    Returns:
+        UTF-8编码的JSON数据
+        
+    Raises:
+        TypeError: 对象无法序列化
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        default=_json_default
+    ).encode('utf-8')
@@ -34,6 +34,9 @@ LLM_MODELS = {
 
 LATEX_DELIMITERS = [{"left": "$$", "right": "$$", "display": True}, {"left": "$", "right": "$", "display": False}]
 
+# 两次UI刷新之间的最小间隔（秒），避免频繁重绘
+UI_YIELD_INTERVAL = 0.1
+
 
 # --- 后端核心逻辑 ---
 
@@ -59,7 +62,8 @@ def test_llm_connection(provider_name: str, api_key: str, model_name: str):
     """测试LLM连接"""
     try:
         client = get_llm_client(provider_name, api_key, model_name)
-        if client.validate_connection():
+        # 显式的连接诊断，不使用缓存的验证结果
+        if client.validate_connection(use_cache=False):
             return "✅ 连接成功"
         else:
             return "❌ 连接失败: 未知错误"
@@ -85,38 +89,54 @@ def run_analysis_pipeline(
     status_updates = []
     req_md_content = "分析中，请稍候..."
     model_search_content = "等待中..."
+    last_yield = 0.0
 
-    def update_status_msg(msg):
-        """仅更新状态文本"""
-        status_updates.append(msg)
+    def render():
+        """构建当前UI输出"""
         return (
             "\n".join(status_updates),
             gr.Markdown(value=req_md_content, latex_delimiters=LATEX_DELIMITERS),
             gr.Markdown(value=model_search_content, latex_delimiters=LATEX_DELIMITERS)
         )
 
-    yield update_status_msg("1. 初始化LLM客户端...")
+    def should_yield(terminal=False):
+        """节流判断：距上次刷新超过间隔或遇到终态事件时才刷新UI"""
+        nonlocal last_yield
+        now = time.monotonic()
+        if terminal or now - last_yield >= UI_YIELD_INTERVAL:
+            last_yield = now
+            return True
+        return False
+
+    def update_status_msg(msg, terminal=False):
+        """追加状态文本，并按节流策略刷新UI"""
+        status_updates.append(msg)
+        if should_yield(terminal):
+            yield render()
+
+    yield from update_status_msg("1. 初始化LLM客户端...", terminal=True)
     try:
         llm_client = get_llm_client(llm_provider, api_key, llm_model)
         if not llm_client.validate_connection():
             raise ValueError("LLM连接验证失败")
-        yield update_status_msg("   ✅ LLM客户端初始化成功")
+        yield from update_status_msg("   ✅ LLM客户端初始化成功")
     except Exception as e:
-        yield update_status_msg(f"   ❌ LLM客户端初始化失败: {e}")
+        yield from update_status_msg(f"   ❌ LLM客户端初始化失败: {e}", terminal=True)
         raise gr.Error("LLM客户端初始化失败", str(e))
 
-    yield update_status_msg("\n2. 创建AutoForge Agent...")
+    yield from update_status_msg("\n2. 创建AutoForge Agent...")
     try:
         agent = AutoForgeAgent(
             llm_client=llm_client,
             output_dir=str(output_dir)
         )
-        yield update_status_msg("   ✅ Agent创建成功")
+        yield from update_status_msg("   ✅ Agent创建成功")
     except Exception as e:
-        yield update_status_msg(f"   ❌ Agent创建失败: {e}")
+        yield from update_status_msg(f"   ❌ Agent创建失败: {e}", terminal=True)
         raise gr.Error("Agent创建失败", str(e))
         
-    yield update_status_msg("\n3. 开始执行分析流程...")
+    # 后续为耗时的分析流程，强制刷新以展示最新状态
+    yield from update_status_msg("\n3. 开始执行分析流程...", terminal=True)
     
     try:
         # 使用for循环处理生成器返回的每个阶段结果
@@ -128,47 +148,27 @@ def run_analysis_pipeline(
             stage_result = result.get("result", {})
             
             if stage == "requirement_analysis":
-                status_updates.append("   - ✅ 需求分析完成")
                 output_file = stage_result.get("output_file", "")
                 if output_file and Path(output_file).exists():
                     req_md_content = Path(output_file).read_text(encoding="utf-8")
                 else:
                     req_md_content = f"### 需求分析报告\n\n文件未找到或生成失败。\n(路径: {output_file or 'N/A'})"
                 model_search_content = "分析中，请稍候..." # 更新下一阶段的状态
-                yield (
-                    "\n".join(status_updates),
-                    gr.Markdown(value=req_md_content, latex_delimiters=LATEX_DELIMITERS),
-                    gr.Markdown(value=model_search_content, latex_delimiters=LATEX_DELIMITERS)
-                )
+                yield from update_status_msg("   - ✅ 需求分析完成", terminal=True)
 
             elif stage == "model_search":
-                status_updates.append("   - ✅ 模型搜索完成")
                 output_file = stage_result.get("output_file", "")
                 if output_file and Path(output_file).exists():
                     model_search_content = Path(output_file).read_text(encoding="utf-8")
                 else:
                     model_search_content = f"### 模型搜索报告\n\n文件未找到或生成失败。\n(路径: {output_file or 'N/A'})"
-                yield (
-                    "\n".join(status_updates),
-                    gr.Markdown(value=req_md_content, latex_delimiters=LATEX_DELIMITERS),
-                    gr.Markdown(value=model_search_content, latex_delimiters=LATEX_DELIMITERS)
-                )
+                yield from update_status_msg("   - ✅ 模型搜索完成", terminal=True)
 
     except Exception as e:
-        status_updates.append(f"\n   ❌ 分析流程出错: {e}")
-        yield (
-            "\n".join(status_updates),
-            gr.Markdown(value=req_md_content, latex_delimiters=LATEX_DELIMITERS),
-            gr.Markdown(value=model_search_content, latex_delimiters=LATEX_DELIMITERS)
-        )
+        yield from update_status_msg(f"\n   ❌ 分析流程出错: {e}", terminal=True)
         raise gr.Error("分析流程执行失败", str(e))
 
-    status_updates.append(f"\n🎉 全部完成！结果保存在目录: {output_dir.resolve()}")
-    yield (
-        "\n".join(status_updates),
-        gr.Markdown(value=req_md_content, latex_delimiters=LATEX_DELIMITERS),
-        gr.Markdown(value=model_search_content, latex_delimiters=LATEX_DELIMITERS)
-    )
+    yield from update_status_msg(f"\n🎉 全部完成！结果保存在目录: {output_dir.resolve()}", terminal=True)
 
 # --- Gradio UI 构建 ---
 
@@ -5,6 +5,7 @@ AutoForge HuggingFace爬虫示例
 
 import os
 import sys
+import asyncio
 import logging
 from pathlib import Path
 
@@ -98,21 +99,28 @@ def demo_model_card_crawling():
         # 可以添加更多模型ID
     ]
     
-    for model_id in model_ids:
-        print(f"\n爬取模型 '{model_id}' 的详细信息...")
+    async def crawl_all():
         try:
-            model_info = crawler.crawl_model_card(model_id)
-            
-            print(f"✅ 成功爬取模型信息")
-            print(f"   - URL: {model_info.get('url')}")
-            print(f"   - 爬取时间: {model_info.get('crawled_at')}")
-            
-            if 'model_card' in model_info:
-                print(f"   - ModelCard长度: {len(model_info['model_card'])} 字符")
-                print(f"   - ModelCard预览: {model_info['model_card'][:200]}...")
+            return await crawler.crawl_model_cards_async(model_ids)
+        finally:
+            await crawler.aclose()
+    
+    print(f"\n并发爬取 {len(model_ids)} 个模型的详细信息...")
+    results = asyncio.run(crawl_all())
+    
+    for model_id, model_info in zip(model_ids, results):
+        print(f"\n模型 '{model_id}':")
+        if isinstance(model_info, Exception):
+            print(f"❌ 爬取失败: {model_info}")
+            continue
         
-        except Exception as e:
-            print(f"❌ 爬取失败: {e}")
+        print(f"✅ 成功爬取模型信息")
+        print(f"   - URL: {model_info.get('url')}")
+        print(f"   - 爬取时间: {model_info.get('crawled_at')}")
+        
+        if 'model_card' in model_info:
+            print(f"   - ModelCard长度: {len(model_info['model_card'])} 字符")
+            print(f"   - ModelCard预览: {model_info['model_card'][:200]}...")
 
 
 def demo_batch_crawling():
@@ -159,17 +167,28 @@ def demo_search():
     # 搜索关键词
     keywords = ["chinese", "llama", "bert"]
     
-    for keyword in keywords:
-        print(f"\n搜索关键词 '{keyword}'...")
+    async def search_all():
+        # 所有关键词共用爬虫的连接池并发搜索
         try:
-            results = crawler.search_models(keyword, top_k=3)
-            print(f"找到 {len(results)} 个结果：")
-            
-            for model in results:
-                print(f"  - {model.get('model_id', 'Unknown')}")
+            return await asyncio.gather(
+                *[crawler.search_models_async(keyword, top_k=3) for keyword in keywords],
+                return_exceptions=True
+            )
+        finally:
+            await crawler.aclose()
+    
+    print(f"并发搜索关键词: {', '.join(keywords)}...")
+    all_results = asyncio.run(search_all())
+    
+    for keyword, results in zip(keywords, all_results):
+        print(f"\n搜索关键词 '{keyword}'...")
+        if isinstance(results, Exception):
+            print(f"搜索失败: {results}")
+            continue
         
-        except Exception as e:
-            print(f"搜索失败: {e}")
+        print(f"找到 {len(results)} 个结果：")
+        for model in results:
+            print(f"  - {model.get('model_id', 'Unknown')}")
 
 
 def main():
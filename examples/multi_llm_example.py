@@ -3,8 +3,10 @@ AutoForge 多LLM提供商示例
 演示如何使用不同的LLM提供商（OpenAI、DeepSeek、百炼）
 """
 
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv  # 新增
 from loguru import logger
@@ -15,8 +17,6 @@ load_dotenv(dotenv_path=Path(__file__).parent / '.env')
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from autoforge import AutoForgeAgent
-from autoforge.llm import OpenAIClient, DeepSeekClient, BaiLianClient
 
 # 屏蔽httpx等三方库日志
 import logging
@@ -26,60 +26,109 @@ logging.getLogger("httpcore").setLevel(logging.WARNING)
 # 在大模型请求前后打印结构体
 # 以OpenAI为例，其他同理
 
-def demo_openai():
+def print_stream(label: str, chunks, out=None) -> str:
+    """边接收边打印流式响应，返回完整文本"""
+    out = out or sys.stdout
+    out.write(f"{label}: ")
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        out.write(chunk)
+        out.flush()
+    out.write("\n")
+    return "".join(parts)
+
+
+def demo_openai(out=None):
     """演示使用OpenAI"""
-    print("\n=== 使用OpenAI ===")
+    from autoforge.llm import OpenAIClient, get_shared_http_client
+    
+    print("\n=== 使用OpenAI ===", file=out)
     try:
         client = OpenAIClient(
-            model="gpt-4.1"
+            model="gpt-4.1",
+            http_client=get_shared_http_client()
         )
         prompt = "你好，请简单介绍一下机器学习"
         logger.info(f"[OpenAI请求] prompt: {prompt}")
-        response = client.generate(prompt)
-        logger.info(f"[OpenAI响应] response: {response}")
-        print(f"OpenAI回复: {response[:100]}...")
+        response = print_stream("OpenAI回复", client.stream(prompt), out=out)
+        logger.info(f"[OpenAI响应] response: {response[:100]}...")
         return client
     except Exception as e:
         logger.error(f"OpenAI示例失败: {e}")
         return None
 
 
-def demo_deepseek():
+def demo_openai_batch_classify():
+    """演示使用OpenAI批量识别多条需求的任务类型（共享系统提示词，一次请求处理多条）"""
+    from autoforge.llm import OpenAIClient, get_shared_http_client
+    
+    print("\n=== 使用OpenAI批量识别需求任务类型 ===")
+    requirements = [
+        "我需要一个模型，判断用户评论是正面还是负面",
+        "把中文产品说明翻译成英文",
+        "识别图片中的常见办公用品",
+        "从合同文本中抽取甲方、乙方和金额",
+    ]
+    system = (
+        "你是机器学习任务分类助手。请为每条需求给出最合适的HuggingFace任务标签"
+        "（如 text-classification、translation、image-classification、token-classification），"
+        "结果只包含标签本身。"
+    )
+    try:
+        client = OpenAIClient(
+            model="gpt-4.1",
+            http_client=get_shared_http_client()
+        )
+        # 结果按条目编号映射回需求顺序，模型未返回的条目为None
+        results = client.generate_multi(requirements, system, temperature=0)
+        for requirement, task in zip(requirements, results):
+            print(f"- {requirement} -> {task or '未返回结果'}")
+        return results
+    except Exception as e:
+        logger.error(f"OpenAI批量识别示例失败: {e}")
+        return None
+
+
+def demo_deepseek(out=None):
     """演示使用DeepSeek"""
-    print("\n=== 使用DeepSeek ===")
+    from autoforge.llm import DeepSeekClient, get_shared_http_client
+    
+    print("\n=== 使用DeepSeek ===", file=out)
     try:
         client = DeepSeekClient(
-            model="deepseek-reasoner"
+            model="deepseek-reasoner",
+            http_client=get_shared_http_client()
         )
         prompt = "你好，请简单介绍一下深度学习"
         logger.info(f"[DeepSeek请求] prompt: {prompt}")
-        response = client.generate(prompt)
-        logger.info(f"[DeepSeek响应] response: {response}")
-        print(f"DeepSeek回复: {response[:100]}...")
+        response = print_stream("DeepSeek回复", client.stream(prompt), out=out)
+        logger.info(f"[DeepSeek响应] response: {response[:100]}...")
         client.set_model("deepseek-reasoner")
         messages = [{"role": "user", "content": "9.11和9.8，哪个更大？请详细解释"}]
         logger.info(f"[DeepSeek Reasoner请求] messages: {messages}")
-        response = client.generate_with_messages(messages)
-        logger.info(f"[DeepSeek Reasoner响应] response: {response}")
-        print(f"DeepSeek Reasoner回复: {response[:100]}...")
+        response = print_stream("DeepSeek Reasoner回复", client.stream_with_messages(messages), out=out)
+        logger.info(f"[DeepSeek Reasoner响应] response: {response[:100]}...")
         return client
     except Exception as e:
         logger.error(f"DeepSeek示例失败: {e}")
         return None
 
 
-def demo_bailian():
+def demo_bailian(out=None):
     """演示使用百炼"""
-    print("\n=== 使用阿里云百炼 ===")
+    from autoforge.llm import BaiLianClient, get_shared_http_client
+    
+    print("\n=== 使用阿里云百炼 ===", file=out)
     try:
         client = BaiLianClient(
-            model="qwen3-235b-a22b"
+            model="qwen3-235b-a22b",
+            http_client=get_shared_http_client()
         )
         prompt = "你好，请简单介绍一下通义千问"
         logger.info(f"[百炼请求] prompt: {prompt}")
-        response = client.generate(prompt, enable_thinking=False)
-        logger.info(f"[百炼响应] response: {response}")
-        print(f"百炼回复: {response[:100]}...")
+        response = print_stream("百炼回复", client.stream(prompt, enable_thinking=False), out=out)
+        logger.info(f"[百炼响应] response: {response[:100]}...")
         return client
     except Exception as e:
         logger.error(f"百炼示例失败: {e}")
@@ -88,6 +137,8 @@ def demo_bailian():
 
 def demo_autoforge_with_different_llms():
     """演示使用不同的LLM运行AutoForge"""
+    from autoforge import AutoForgeAgent
+    
     print("\n=== 使用不同LLM运行AutoForge ===")
     
     # 测试需求
@@ -100,23 +151,26 @@ def demo_autoforge_with_different_llms():
     4. 部署环境：普通CPU服务器
     """
     
-    # 获取可用的LLM客户端
-    available_clients = []
+    # 并发探测各LLM提供商（互不依赖的网络请求），输出按提供商分别缓冲后依次打印
+    providers = [("OpenAI", demo_openai), ("DeepSeek", demo_deepseek), ("百炼", demo_bailian)]
+    buffers = [io.StringIO() for _ in providers]
     
-    # 尝试OpenAI
-    openai_client = demo_openai()
-    if openai_client:
-        available_clients.append(("OpenAI", openai_client))
+    with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+        clients = list(executor.map(
+            lambda provider, buffer: provider[1](out=buffer),
+            providers,
+            buffers
+        ))
     
-    # 尝试DeepSeek
-    deepseek_client = demo_deepseek()
-    if deepseek_client:
-        available_clients.append(("DeepSeek", deepseek_client))
+    for buffer in buffers:
+        sys.stdout.write(buffer.getvalue())
     
-    # 尝试百炼
-    bailian_client = demo_bailian()
-    if bailian_client:
-        available_clients.append(("百炼", bailian_client))
+    # 获取可用的LLM客户端（保持提供商顺序）
+    available_clients = [
+        (name, client)
+        for (name, _), client in zip(providers, clients)
+        if client
+    ]
     
     # 使用可用的客户端运行AutoForge
     for name, client in available_clients:
@@ -159,6 +213,8 @@ def demo_single_model(model_name: str):
 
 def demo_autoforge_with_single_llm(model_choice: str):
     """使用单个指定的LLM运行AutoForge"""
+    from autoforge import AutoForgeAgent
+    
     name, client = demo_single_model(model_choice)
     
     if not client:
@@ -215,8 +271,9 @@ def main():
     print("2. 使用所有可用LLM运行AutoForge")
     print("3. 选择特定LLM测试")
     print("4. 使用特定LLM运行AutoForge")
+    print("5. 使用OpenAI批量识别需求任务类型")
     
-    choice = input("\n请输入选择(1-4): ").strip()
+    choice = input("\n请输入选择(1-5): ").strip()
     
     if choice == "1":
         demo_openai()
@@ -238,6 +295,8 @@ def main():
         print("3. 百炼")
         model_choice = input("请输入选择(1-3): ").strip()
         demo_autoforge_with_single_llm(model_choice)
+    elif choice == "5":
+        demo_openai_batch_classify()
     else:
         print("无效的选择")
 
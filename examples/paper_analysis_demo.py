@@ -5,8 +5,11 @@
 
 import os
 import sys
+import asyncio
+import argparse
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
 
 # 添加项目根目录到路径
@@ -26,11 +29,41 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# 论文详情抓取的默认并发线程数（I/O密集型任务，可通过环境变量PWC_MAX_WORKERS调整）
+DEFAULT_DETAIL_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 5)
 
-def main():
-    """主函数"""
+
+def get_detail_max_workers() -> int:
+    """
+    读取论文详情抓取的并发线程数
+    
+    Returns:
+        环境变量PWC_MAX_WORKERS指定的线程数（至少为1），未设置或无法解析时返回默认值
+    """
+    value = os.environ.get("PWC_MAX_WORKERS")
+    if value is None:
+        return DEFAULT_DETAIL_MAX_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"PWC_MAX_WORKERS 不是有效的整数: {value!r}，使用默认值 {DEFAULT_DETAIL_MAX_WORKERS}")
+        return DEFAULT_DETAIL_MAX_WORKERS
+
+
+def main(use_cache: bool = True):
+    """
+    主函数
     
-    # 1. 初始化LLM客户端（使用百炼API）
+    Args:
+        use_cache: 是否复用搜索、论文详情和LLM响应的缓存
+    """
+    # 1. 设置输出目录
+    output_dir = Path("outputs/paper_analysis_demo")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = output_dir / ".cache" if use_cache else None
+    detail_max_workers = get_detail_max_workers()
+    
+    # 2. 初始化LLM客户端（使用百炼API）
     api_key = os.environ.get("BAILIAN_API_KEY")
     model = os.environ.get("BAILIAN_MODEL", "qwen-plus")
     
@@ -40,16 +73,15 @@ def main():
     else:
         llm_client = BaiLianClient(
             api_key=api_key,
-            model=model
+            model=model,
+            cache_dir=str(cache_dir / "llm") if cache_dir else None
         )
     
-    # 2. 设置输出目录
-    output_dir = Path("outputs/paper_analysis_demo")
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
     # 3. 初始化组件
-    pwc_crawler = PapersWithCodeCrawler(output_dir=str(output_dir / "pwc_results"))
-    paper_downloader = PaperDownloader(output_dir=str(output_dir / "papers"))
+    pwc_crawler = PapersWithCodeCrawler(
+        output_dir=str(output_dir / "pwc_results"),
+        cache_dir=str(cache_dir / "pwc") if cache_dir else None
+    )
     paper_analyzer = PaperAnalyzer(llm_client=llm_client, output_dir=str(output_dir))
     paper_code_analyzer = PaperCodeAnalyzer(llm_client=llm_client, output_dir=str(output_dir))
     
@@ -71,60 +103,72 @@ def main():
         logger.error(f"搜索论文失败: {e}")
         return
     
-    # 6. 获取论文详情
+    # 6. 并发获取论文详情
+    def fetch_details(paper):
+        if "url" not in paper:
+            return paper
+        try:
+            return pwc_crawler.crawl_paper_details(paper["url"])
+        except Exception as e:
+            logger.error(f"获取论文详情失败: {paper['url']}, 错误: {e}")
+            return paper
+    
     try:
-        detailed_papers = []
-        for paper in papers:
-            if "url" in paper:
-                paper_details = pwc_crawler.crawl_paper_details(paper["url"])
-                detailed_papers.append(paper_details)
-            else:
-                detailed_papers.append(paper)
+        with ThreadPoolExecutor(max_workers=min(detail_max_workers, len(papers))) as executor:
+            detailed_papers = list(executor.map(fetch_details, papers))
         
         logger.info(f"成功获取 {len(detailed_papers)} 篇论文的详细信息")
     except Exception as e:
         logger.error(f"获取论文详情失败: {e}")
         detailed_papers = papers
     
-    # 7. 下载论文PDF
-    downloaded_papers = []
+    # 7. 并发下载论文PDF
+    papers_with_pdf = []
     for paper in detailed_papers:
-        try:
-            # 获取PDF链接
-            pdf_url = None
-            paper_links = paper.get("paper_links", {})
-            
-            # 优先使用arxiv链接
-            if "arxiv" in paper_links:
-                pdf_url = paper_links["arxiv"]
-                if not pdf_url.endswith(".pdf"):
-                    pdf_url = pdf_url.replace("abs", "pdf") + ".pdf"
-            # 其次使用pdf链接
-            elif "pdf" in paper_links:
-                pdf_url = paper_links["pdf"]
-            
-            if pdf_url:
-                logger.info(f"下载论文: {paper.get('title', '未知标题')}")
-                pdf_path = paper_downloader.download_paper(pdf_url)
-                
-                if pdf_path:
-                    downloaded_papers.append({
-                        "path": pdf_path,
-                        "meta": {
-                            "title": paper.get("title", ""),
-                            "authors": paper.get("authors", []),
-                            "url": paper.get("url", ""),
-                            "github_repos": paper.get("github_repos", [])
-                        }
-                    })
-                    logger.info(f"论文下载成功: {pdf_path}")
-                else:
-                    logger.warning(f"论文下载失败: {paper.get('title', '未知标题')}")
-            else:
-                logger.warning(f"未找到PDF链接: {paper.get('title', '未知标题')}")
+        # 获取PDF链接
+        pdf_url = None
+        paper_links = paper.get("paper_links", {})
+        
+        # 优先使用arxiv链接
+        if "arxiv" in paper_links:
+            pdf_url = paper_links["arxiv"]
+            if not pdf_url.endswith(".pdf"):
+                pdf_url = pdf_url.replace("abs", "pdf") + ".pdf"
+        # 其次使用pdf链接
+        elif "pdf" in paper_links:
+            pdf_url = paper_links["pdf"]
         
+        if pdf_url:
+            papers_with_pdf.append((paper, pdf_url))
+        else:
+            logger.warning(f"未找到PDF链接: {paper.get('title', '未知标题')}")
+    
+    downloaded_papers = []
+    # 下载结束后关闭下载器，释放下载清单的数据库连接
+    with PaperDownloader(output_dir=str(output_dir / "papers")) as paper_downloader:
+        try:
+            pdf_paths = asyncio.run(paper_downloader.download_papers_async(
+                [pdf_url for _, pdf_url in papers_with_pdf]
+            ))
         except Exception as e:
-            logger.error(f"处理论文时出错: {e}")
+            logger.error(f"下载论文时出错: {e}")
+            pdf_paths = {}
+    
+    for paper, pdf_url in papers_with_pdf:
+        pdf_path = pdf_paths.get(pdf_url)
+        if pdf_path:
+            downloaded_papers.append({
+                "path": pdf_path,
+                "meta": {
+                    "title": paper.get("title", ""),
+                    "authors": paper.get("authors", []),
+                    "url": paper.get("url", ""),
+                    "github_repos": paper.get("github_repos", [])
+                }
+            })
+            logger.info(f"论文下载成功: {pdf_path}")
+        else:
+            logger.warning(f"论文下载失败: {paper.get('title', '未知标题')}")
     
     logger.info(f"成功下载 {len(downloaded_papers)} 篇论文")
     
@@ -132,29 +176,28 @@ def main():
         logger.error("未成功下载任何论文，退出程序")
         return
     
-    # 8. 分析论文内容
+    # 8. 并发分析论文内容
     paper_analyses = []
-    for paper in downloaded_papers:
-        try:
-            logger.info(f"分析论文: {paper['meta'].get('title', '未知标题')}")
-            
-            analysis_result = paper_analyzer.analyze_paper(
-                paper_path=paper["path"],
-                paper_meta=paper["meta"],
-                options={
-                    "analysis_type": "full",
-                    "max_tokens": 6000
-                }
-            )
-            
-            if analysis_result["success"]:
-                paper_analyses.append(analysis_result)
-                logger.info(f"论文分析成功: {paper['meta'].get('title', '未知标题')}")
-            else:
-                logger.warning(f"论文分析失败: {analysis_result.get('error', '未知错误')}")
-        
-        except Exception as e:
-            logger.error(f"分析论文时出错: {e}")
+    try:
+        analysis_results = asyncio.run(paper_analyzer.analyze_papers_async(
+            downloaded_papers,
+            options={
+                "analysis_type": "full",
+                "max_tokens": 6000
+            },
+            max_concurrency=4
+        ))
+    except Exception as e:
+        logger.error(f"分析论文时出错: {e}")
+        analysis_results = []
+    
+    for analysis_result in analysis_results:
+        title = analysis_result.get("paper_meta", {}).get("title", "未知标题")
+        if analysis_result["success"]:
+            paper_analyses.append(analysis_result)
+            logger.info(f"论文分析成功: {title}")
+        else:
+            logger.warning(f"论文分析失败: {analysis_result.get('error', '未知错误')}")
     
     logger.info(f"成功分析 {len(paper_analyses)} 篇论文")
     
@@ -162,8 +205,8 @@ def main():
         logger.error("未成功分析任何论文，退出程序")
         return
     
-    # 9. 分析GitHub仓库
-    relation_analyses = []
+    # 9. 并发分析GitHub仓库（按论文分发，克隆并发数由仓库分析器限制）
+    repo_tasks = []
     for paper_analysis in paper_analyses:
         paper_meta = paper_analysis.get("paper_meta", {})
         github_repos = paper_meta.get("github_repos", [])
@@ -174,21 +217,28 @@ def main():
         
         # 限制仓库数量，避免处理时间过长
         repo_urls = [repo["url"] for repo in github_repos[:2]]
-        
-        logger.info(f"分析论文与 {len(repo_urls)} 个GitHub仓库的关系")
-        
-        try:
-            paper_repo_analyses = paper_code_analyzer.analyze_paper_with_repos(
-                paper_analysis=paper_analysis,
-                repo_urls=repo_urls
-            )
-            
-            relation_analyses.extend(paper_repo_analyses)
+        repo_tasks.append((paper_analysis, repo_urls))
+    
+    relation_analyses = []
+    if repo_tasks:
+        with ThreadPoolExecutor(max_workers=min(4, len(repo_tasks))) as executor:
+            futures = [
+                executor.submit(
+                    paper_code_analyzer.analyze_paper_with_repos,
+                    paper_analysis=paper_analysis,
+                    repo_urls=repo_urls
+                )
+                for paper_analysis, repo_urls in repo_tasks
+            ]
             
-            logger.info(f"成功分析 {len(paper_repo_analyses)} 个仓库")
-        
-        except Exception as e:
-            logger.error(f"分析GitHub仓库时出错: {e}")
+            # 按提交顺序收集结果，保证每次运行的报告顺序一致
+            for (_, repo_urls), future in zip(repo_tasks, futures):
+                try:
+                    paper_repo_analyses = future.result()
+                    relation_analyses.extend(paper_repo_analyses)
+                    logger.info(f"成功分析 {len(paper_repo_analyses)} 个仓库")
+                except Exception as e:
+                    logger.error(f"分析GitHub仓库时出错: {repo_urls}, 错误: {e}")
     
     # 10. 对实现进行排名
     if relation_analyses:
@@ -228,4 +278,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="论文分析示例")
+    parser.add_argument("--no-cache", action="store_true", help="忽略并不写入本地缓存")
+    args = parser.parse_args()
+    main(use_cache=not args.no_cache) 
\ No newline at end of file
@@ -6,44 +6,90 @@ Papers with Code 论文爬取和GitHub仓库分析示例
 
 import os
 import sys
+import atexit
+import asyncio
 import logging
+import logging.handlers
 import json
-import time
+import gzip
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, TYPE_CHECKING
 import traceback
-import requests
+
+# 延迟导入，避免依赖问题
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # ISA-L的SIMD实现，接口与标准库gzip一致
+    from isal import igzip as gzip_module
+except ImportError:
+    gzip_module = gzip
 
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from autoforge.crawler import PapersWithCodeCrawler
-from autoforge.analyzers import GitHubRepoAnalyzer
+# 爬虫和分析器依赖较重，在main()中再导入，导入本模块或查看帮助时无需加载
+if TYPE_CHECKING:
+    from autoforge.crawler import PapersWithCodeCrawler, GitHubRepoAnalyzer
 
-# 配置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('pwc_github_analysis.log')
-    ]
+# 配置日志：文件日志先在内存中缓冲，满1024条或出现ERROR时再批量写入磁盘
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+file_handler = logging.FileHandler('pwc_github_analysis.log', encoding='utf-8')
+file_handler.setFormatter(log_formatter)
+buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.ERROR,
+    target=file_handler
 )
+# 退出时写出缓冲区中剩余的日志
+atexit.register(buffered_file_handler.close)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(stream_handler)
+root_logger.addHandler(buffered_file_handler)
 
 logger = logging.getLogger(__name__)
 
 
+def dump_json(obj, path: Path):
+    """保存JSON文件，优先使用orjson（C扩展，直接输出UTF-8字节）；路径以.gz结尾时压缩保存"""
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    if path.suffix == '.gz':
+        # 压缩级别1速度接近内存拷贝，JSON中重复的字段名和URL前缀仍能大幅压缩；读取时用gzip.open即可
+        with gzip_module.open(path, 'wb', compresslevel=1) as f:
+            f.write(payload)
+        return
+    
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+
 def main():
     """主函数"""
     # 创建输出目录
     output_dir = Path("outputs/pwc_analysis")
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    from autoforge.crawler import PapersWithCodeCrawler, GitHubRepoAnalyzer
+    
     # 初始化爬虫和分析器
     pwc_crawler = PapersWithCodeCrawler(
         output_dir=str(output_dir / "papers"),
         max_retries=5,         # 增加重试次数
         timeout=120,           # 更长的超时时间
-        delay=2.0              # 更长的请求间隔
+        delay=2.0,             # 更长的请求间隔
+        cache_dir=str(output_dir / ".http_cache")  # 论文详情跨运行复用
     )
     repo_analyzer = GitHubRepoAnalyzer(
         workspace_dir=str(output_dir / "repos"),
@@ -51,6 +97,16 @@ def main():
         output_dir=str(output_dir / "repos_analysis")
     )
     
+    try:
+        analyze_papers_and_repos(pwc_crawler, repo_analyzer, output_dir)
+    finally:
+        pwc_crawler.close()
+
+
+def analyze_papers_and_repos(pwc_crawler: "PapersWithCodeCrawler",
+                             repo_analyzer: "GitHubRepoAnalyzer",
+                             output_dir: Path):
+    """爬取论文并分析关联的GitHub仓库"""
     trending_papers = []
     area_papers = []
     search_papers = []
@@ -100,23 +156,39 @@ def main():
         return
     
     # 输出爬取到的论文标题
-    logger.info("爬取到的论文:")
-    for i, paper in enumerate(papers_to_analyze):
-        logger.info(f"{i+1}. {paper.get('title', 'Unknown Title')} - URL: {paper.get('url', 'No URL')}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("爬取到的论文:")
+        for i, paper in enumerate(papers_to_analyze):
+            logger.info(f"{i+1}. {paper.get('title', 'Unknown Title')} - URL: {paper.get('url', 'No URL')}")
     
     # 爬取论文详情（包括GitHub仓库信息）
     detailed_papers = []
     try:
         logger.info("开始获取论文详情...")
-        detailed_papers = pwc_crawler.crawl_papers_batch(papers_to_analyze)
+        # 列表结果中已带有GitHub仓库的论文无需再请求详情页
+        has_repos = [bool(paper.get('github_repos')) for paper in papers_to_analyze]
+        needs_detail = [paper for paper, ok in zip(papers_to_analyze, has_repos) if not ok]
+        logger.info(f"{len(papers_to_analyze) - len(needs_detail)} 篇论文已包含仓库信息，"
+                    f"需获取详情的论文: {len(needs_detail)} 篇")
+        
+        fetched_ids = set()
+        if needs_detail:
+            # 并发抓取论文详情页（共享连接池，信号量限制并发数），详情原地合并到论文字典中
+            fetched = asyncio.run(pwc_crawler.crawl_papers_batch_async(needs_detail))
+            fetched_ids = {id(paper) for paper in fetched}
+        
+        # 按原始顺序合并两部分结果
+        detailed_papers = [
+            paper for paper, ok in zip(papers_to_analyze, has_repos)
+            if ok or id(paper) in fetched_ids
+        ]
         
         # 保存详细结果
-        papers_file = output_dir / "detailed_papers.json"
-        with open(papers_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'count': len(detailed_papers),
-                'papers': detailed_papers
-            }, f, ensure_ascii=False, indent=2)
+        papers_file = output_dir / "detailed_papers.json.gz"
+        dump_json({
+            'count': len(detailed_papers),
+            'papers': detailed_papers
+        }, papers_file)
         logger.info(f"论文详情已保存至: {papers_file}")
     except Exception as e:
         logger.error(f"获取论文详情失败: {e}")
@@ -124,33 +196,36 @@ def main():
         # 如果获取详情失败，使用基本信息继续
         detailed_papers = papers_to_analyze
     
-    # 提取GitHub仓库URL
-    repo_urls = []
+    # 如果详情中没有仓库信息，但实现数量表明有代码实现，则并发重新爬取论文页面
+    missing_urls = [
+        paper['url'] for paper in detailed_papers
+        if not paper.get('github_repos') and paper.get('implementation_count', 0) > 0 and paper.get('url')
+    ]
+    
+    def fetch_github_repos(paper_url: str):
+        try:
+            logger.info(f"从论文页面获取仓库链接: {paper_url}")
+            return pwc_crawler.crawl_paper_details(paper_url).get('github_repos', [])
+        except Exception as e:
+            logger.error(f"获取论文 {paper_url} 的仓库链接失败: {e}")
+            return []
+    
+    fallback_repos = {}
+    if missing_urls:
+        # 工作线程共享爬虫会话的连接池
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            fallback_repos = dict(zip(missing_urls, executor.map(fetch_github_repos, missing_urls)))
+    
+    # 提取GitHub仓库URL（dict保持插入顺序，去重为O(1)）
+    repo_urls: Dict[str, None] = {}
     for paper in detailed_papers:
-        # 尝试从详情中获取仓库
-        github_repos = paper.get('github_repos', [])
-        if github_repos:
-            for repo in github_repos:
-                repo_url = repo.get('url', '')
-                if repo_url and repo_url not in repo_urls:
-                    repo_urls.append(repo_url)
-        
-        # 如果详情中没有仓库信息，尝试从实现数量猜测是否有实现
-        elif paper.get('implementation_count', 0) > 0:
-            # 获取论文URL，尝试直接爬取详情
-            paper_url = paper.get('url', '')
-            if paper_url:
-                try:
-                    logger.info(f"从论文页面获取仓库链接: {paper_url}")
-                    paper_detail = pwc_crawler.crawl_paper_details(paper_url)
-                    repos = paper_detail.get('github_repos', [])
-                    for repo in repos:
-                        repo_url = repo.get('url', '')
-                        if repo_url and repo_url not in repo_urls:
-                            repo_urls.append(repo_url)
-                except Exception as e:
-                    logger.error(f"获取论文 {paper_url} 的仓库链接失败: {e}")
+        github_repos = paper.get('github_repos') or fallback_repos.get(paper.get('url', ''), [])
+        for repo in github_repos:
+            repo_url = repo.get('url', '')
+            if repo_url:
+                repo_urls.setdefault(repo_url, None)
     
+    repo_urls = list(repo_urls)
     logger.info(f"共发现 {len(repo_urls)} 个GitHub仓库")
     
     # 如果没有找到仓库，添加一些已知的好仓库作为示例
@@ -167,12 +242,28 @@ def main():
         logger.info("开始分析GitHub仓库...")
         # 限制分析数量，避免耗时过长
         repos_to_analyze = repo_urls[:3]
-        analysis_results = repo_analyzer.batch_analyze_repos(repos_to_analyze)
+        analysis_results = []
+        
+        # 摘要所需字段可通过GraphQL一次性获取，避免逐个克隆仓库
+        if os.getenv("GITHUB_TOKEN"):
+            try:
+                analysis_results = repo_analyzer.summary_only_batch(repos_to_analyze)
+            except Exception as e:
+                logger.warning(f"GraphQL获取仓库摘要失败，改为克隆分析: {e}")
+        
+        if analysis_results:
+            # 仅对GraphQL未能获取的仓库回退到克隆分析
+            failed = [i for i, result in enumerate(analysis_results) if result.get('status') != 'success']
+            if failed:
+                cloned = repo_analyzer.batch_analyze_repos([repos_to_analyze[i] for i in failed])
+                for i, result in zip(failed, cloned):
+                    analysis_results[i] = result
+        else:
+            analysis_results = repo_analyzer.batch_analyze_repos(repos_to_analyze)
         
         # 保存分析结果
-        analysis_file = output_dir / "repo_analysis.json"
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, ensure_ascii=False, indent=2)
+        analysis_file = output_dir / "repo_analysis.json.gz"
+        dump_json(analysis_results, analysis_file)
         logger.info(f"仓库分析结果已保存至: {analysis_file}")
         
         # 打印分析摘要
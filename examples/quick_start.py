@@ -13,14 +13,15 @@ load_dotenv(dotenv_path=Path(__file__).parent / '.env')
 # 添加项目根目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from autoforge import AutoForgeAgent
+from autoforge import AutoForgeAgent, configure_third_party_logging
 from autoforge.llm import BaiLianClient, DeepSeekClient
 
 # 配置日志
 from loguru import logger
-import logging
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
+configure_third_party_logging()
+
+# 支持分析的测试图片格式
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
 
 
 def main():
@@ -130,26 +131,32 @@ def main():
         
         # 创建一个测试图片目录（如果不存在）
         test_image_dir = Path("examples/test_images")
-        if test_image_dir.exists() and any(test_image_dir.glob("*.jpg")) or any(test_image_dir.glob("*.png")):
-            # 找到第一张图片进行测试
-            image_files = list(test_image_dir.glob("*.jpg")) + list(test_image_dir.glob("*.png"))
-            if image_files:
-                test_image = str(image_files[0])
-                print(f"📸 正在分析图片: {test_image}")
-                
-                try:
-                    result = llm_client.analyze_image(
-                        image_path=test_image,
-                        prompt="请详细描述这张图片的内容，包括文字、图表、关键信息等。"
-                    )
-                    print(f"✅ 图片分析完成")
-                    print(f"📄 分析结果:\n{result[:200]}...")  # 只显示前200个字符
-                except Exception as e:
-                    print(f"❌ 图片分析失败: {e}")
-            else:
-                print("📁 在 examples/test_images/ 目录下没有找到测试图片")
+        # 递归遍历目录（含子目录），同时选出最近修改的图片；目录不存在时os.walk不产生结果
+        test_image = None
+        newest_mtime = -1.0
+        for root, _, files in os.walk(test_image_dir):
+            for name in files:
+                if os.path.splitext(name)[1].lower() in IMAGE_SUFFIXES:
+                    path = os.path.join(root, name)
+                    mtime = os.stat(path).st_mtime
+                    if mtime > newest_mtime:
+                        test_image, newest_mtime = path, mtime
+        
+        if test_image:
+            # 使用最新放入的图片进行测试
+            print(f"📸 正在分析图片: {test_image}")
+            
+            try:
+                result = llm_client.analyze_image(
+                    image_path=test_image,
+                    prompt="请详细描述这张图片的内容，包括文字、图表、关键信息等。"
+                )
+                print(f"✅ 图片分析完成")
+                print(f"📄 分析结果:\n{result[:200]}...")  # 只显示前200个字符
+            except Exception as e:
+                print(f"❌ 图片分析失败: {e}")
         else:
-            print("📁 请在 examples/test_images/ 目录下放置一些测试图片（jpg/png格式）")
+            print("📁 请在 examples/test_images/ 目录下放置一些测试图片（jpg/png/webp格式）")
 
 
 if __name__ == "__main__":
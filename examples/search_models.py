@@ -1,11 +1,18 @@
 import os
 import sys
 import time
+import atexit
+import asyncio
 import threading
 import json
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 加载环境变量
 load_dotenv()
 
@@ -18,20 +25,24 @@ OUTPUT_DIR = "outputs/video_title_normalization"  # 输出目录
 LOG_FILE = "autoforge_demo.log"                   # 日志文件名
 DIR_MAX_FILES_DISPLAY = 10                        # 目录列表最大显示文件数
 
+# 日志格式配置（loguru在添加处理器时编译格式模板，每条日志不再重复解析）
+CONSOLE_LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan> | <level>{message}</level>"
+FILE_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name} | {message}"
+
 # 模型选择配置 - 指定要使用的模型
 SELECTED_MODEL = "deepseek-reasoner"  # 可选: "deepseek-reasoner", "qwen-plus"
 
-# 模型配置映射 - 从环境变量中读取
+# 模型配置映射 - API密钥从api_key_env指定的环境变量中读取
 MODEL_CONFIGS = {
     "deepseek-reasoner": {
         "provider": "DeepSeek",
-        "api_key": os.getenv("DEEPSEEK_API_KEY", ""),
+        "api_key_env": "DEEPSEEK_API_KEY",
         "model_name": "deepseek-reasoner",
         "client_class": "DeepSeekClient"
     },
     "qwen-plus": {
         "provider": "阿里云百炼",
-        "api_key": os.getenv("BAILIAN_API_KEY", ""),
+        "api_key_env": "BAILIAN_API_KEY",
         "model_name": "qwen-plus", 
         "client_class": "BaiLianClient"
     }
@@ -41,7 +52,11 @@ MODEL_CONFIGS = {
 if SELECTED_MODEL not in MODEL_CONFIGS:
     raise ValueError(f"不支持的模型: {SELECTED_MODEL}. 支持的模型: {list(MODEL_CONFIGS.keys())}")
 
-CURRENT_MODEL_CONFIG = MODEL_CONFIGS[SELECTED_MODEL]
+# 只读取所选模型的API密钥
+CURRENT_MODEL_CONFIG = {
+    **MODEL_CONFIGS[SELECTED_MODEL],
+    "api_key": os.getenv(MODEL_CONFIGS[SELECTED_MODEL]["api_key_env"], "")
+}
 
 # 验证API密钥是否存在
 if not CURRENT_MODEL_CONFIG["api_key"]:
@@ -52,6 +67,7 @@ API_KEY = CURRENT_MODEL_CONFIG["api_key"]
 MODEL_NAME = CURRENT_MODEL_CONFIG["model_name"]
 PROVIDER_NAME = CURRENT_MODEL_CONFIG["provider"]
 CLIENT_CLASS = CURRENT_MODEL_CONFIG["client_class"]
+PROVIDER_MODEL_STR = f"{PROVIDER_NAME} {MODEL_NAME}"  # 日志和摘要中显示的模型名称
 
 # 爬虫配置
 MODEL_CRAWL_COUNT = 30  # 每种任务类型爬取的模型数量
@@ -59,11 +75,13 @@ TEXT2TEXT_MODEL_DETAIL_COUNT = 30  # 获取详细信息的text2text模型数量
 TEXT_GEN_MODEL_DETAIL_COUNT = 10   # 获取详细信息的text-generation模型数量
 DISPLAY_MODEL_COUNT = 30           # 在LLM提示中显示的模型数量
 PRINT_MODEL_COUNT = 10             # 在控制台打印的模型数量
+MODEL_DETAIL_WORKERS = 8           # 并发获取模型详细信息的请求数
 
 # LLM参数配置
 TEXT2TEXT_SAMPLE_COUNT = 30        # 传递给LLM的text2text模型样本数量
 TEXT_GEN_SAMPLE_COUNT = 15         # 传递给LLM的text-generation模型样本数量
 REQUEST_TIMEOUT = 300              # 请求超时时间(秒)，5分钟
+VALIDATION_CACHE_TTL = 3600        # 连接验证结果的缓存时间(秒)
 
 # 监控配置
 MONITOR_INTERVAL = 10              # 监控日志输出间隔(秒)
@@ -149,17 +167,17 @@ from loguru import logger
 
 # 移除默认处理器
 logger.remove()
+# 各处理器使用enqueue=True，日志写入由后台线程完成，不阻塞爬取和监控流程
 # 添加控制台处理器
-logger.add(sys.stdout, level="INFO", 
-           format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan> | <level>{message}</level>")
-# 添加文件处理器
-logger.add(LOG_FILE, level="DEBUG", encoding="utf-8",
-           format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name} | {message}")
-
-# 过滤掉httpx和httpcore的日志
-import logging
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
+logger.add(sys.stdout, level="INFO", enqueue=True, backtrace=False, diagnose=False,
+           format=CONSOLE_LOG_FORMAT)
+# 添加文件处理器：enqueue=True时日志经队列交给单个后台线程写入，buffering=65536让该线程
+# 连续写出的多条日志先进入64KB文件缓冲，再合并为较少的系统调用；退出前由下方注册的
+# logger.complete()等待队列写空，处理器关闭时刷新缓冲，因此不会丢失尾部日志
+logger.add(LOG_FILE, level="DEBUG", encoding="utf-8", enqueue=True, backtrace=False, diagnose=False,
+           buffering=65536, format=FILE_LOG_FORMAT)
+# 退出前等待队列中的日志全部写出
+atexit.register(logger.complete)
 
 # 设置请求超时处理（跨平台兼容）
 class TimeoutError(Exception):
@@ -169,7 +187,7 @@ class TimeoutManager:
     def __init__(self, seconds, error_message="操作超时"):
         self.seconds = seconds
         self.error_message = error_message
-        self.timer = None
+        self.deadline = None
         
     def __enter__(self):
         self.start()
@@ -178,49 +196,42 @@ class TimeoutManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.cancel()
         
-    def timeout_handler(self):
-        """超时处理函数"""
-        # 直接在当前线程内引发超时异常
-        # 这不会中断主线程，但会设置一个标志，供我们检查
-        self.timeout_occurred = True
-        
     def start(self):
-        """启动超时计时器"""
-        self.timeout_occurred = False
-        self.timer = threading.Timer(self.seconds, self.timeout_handler)
-        self.timer.daemon = True
-        self.timer.start()
+        """记录截止时间"""
+        # 超时只在阻塞调用返回后检查，比较单调时钟即可，无需为计时单独创建线程
+        self.deadline = time.monotonic() + self.seconds
         
     def cancel(self):
-        """取消超时计时器"""
-        if self.timer:
-            self.timer.cancel()
+        """取消超时检查"""
+        self.deadline = None
             
     def check_timeout(self):
         """检查是否发生超时"""
-        if self.timeout_occurred:
+        if self.deadline is not None and time.monotonic() > self.deadline:
             raise TimeoutError(self.error_message)
 
 # 打印格式化文本
+SEPARATOR = "=" * 80
+
 def print_formatted_text(text, title="文本内容"):
-    """格式化打印文本内容"""
-    separator = "=" * 80
-    print(f"\n{separator}")
-    print(f"【{title}】")
-    print(f"{separator}")
-    print(text)
-    print(f"{separator}\n")
-
-# 添加项目根目录到Python路径
-root_dir = str(Path(__file__).parent.parent)
-sys.path.insert(0, root_dir)
-logger.info(f"项目根目录已添加到Python路径: {root_dir}")
+    """格式化打印文本内容（拼接后一次写出）"""
+    sys.stdout.write(f"\n{SEPARATOR}\n【{title}】\n{SEPARATOR}\n{text}\n{SEPARATOR}\n\n")
+    sys.stdout.flush()
+
+# 添加项目根目录到Python路径（避免重复添加）
+root_dir = str(Path(__file__).resolve().parent.parent)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+    logger.info(f"项目根目录已添加到Python路径: {root_dir}")
 
 try:
     logger.info("开始导入AutoForge模块...")
-    from autoforge import AutoForgeAgent
+    from autoforge import AutoForgeAgent, configure_third_party_logging
     from autoforge.llm import DeepSeekClient, BaiLianClient
     logger.info("AutoForge模块导入成功")
+    
+    # 过滤掉httpx和httpcore的日志
+    configure_third_party_logging()
 except Exception as e:
     logger.error(f"导入AutoForge模块失败: {e}")
     raise
@@ -246,11 +257,6 @@ try:
         )
         logger.info(f"{PROVIDER_NAME}客户端初始化成功")
         
-        # 测试客户端连接
-        logger.info(f"测试{PROVIDER_NAME}客户端连接...")
-        test_result = active_client.validate_connection()
-        logger.info(f"{PROVIDER_NAME}连接测试结果: {'成功' if test_result else '失败'}")
-        
     elif CLIENT_CLASS == "BaiLianClient":
         active_client = BaiLianClient(
             api_key=API_KEY,
@@ -260,6 +266,11 @@ try:
         
     else:
         raise ValueError(f"不支持的客户端类型: {CLIENT_CLASS}")
+    
+    # 测试客户端连接（1小时内验证成功过则直接复用结果，不再请求API）
+    logger.info(f"测试{PROVIDER_NAME}客户端连接...")
+    test_result = active_client.validate_connection(ttl=VALIDATION_CACHE_TTL)
+    logger.info(f"{PROVIDER_NAME}连接测试结果: {'成功' if test_result else '失败'}")
         
 except Exception as e:
     logger.error(f"初始化{PROVIDER_NAME}客户端失败: {e}")
@@ -269,30 +280,29 @@ except Exception as e:
 logger.info("创建AutoForge Agent...")
 try:
     agent = AutoForgeAgent(llm_client=active_client, output_dir=OUTPUT_DIR)
-    logger.info(f"AutoForge Agent创建成功，使用模型: {active_model_info['provider']} {active_model_info['model_name']}")
+    logger.info(f"AutoForge Agent创建成功，使用模型: {PROVIDER_MODEL_STR}")
 except Exception as e:
     logger.error(f"创建AutoForge Agent失败: {e}")
     raise
 
 # 监控LLM请求情况
-def monitor_llm_response(operation_name):
-    """监控LLM响应情况，定期输出等待状态"""
+def monitor_llm_response(operation_name, done_event):
+    """监控LLM响应情况，定期输出等待状态；done_event被设置后立即退出"""
     start_time = time.time()
-    i = 1
-    while True:
+    for _ in range(MAX_MONITOR_COUNT):  # 使用全局变量
+        # wait在事件被设置时立即返回True，无需等满监控间隔
+        if done_event.wait(MONITOR_INTERVAL):  # 使用全局变量
+            return
         elapsed = time.time() - start_time
         logger.info(f"{operation_name} - 仍在等待响应... (已等待 {elapsed:.1f} 秒)")
-        time.sleep(MONITOR_INTERVAL)  # 使用全局变量
-        i += 1
-        if i > MAX_MONITOR_COUNT:  # 使用全局变量
-            break
 
 # 分析需求
 logger.info("开始需求分析...")
 start_time = time.time()
+done_event = threading.Event()
 try:
     # 创建监控线程
-    monitor_thread = threading.Thread(target=monitor_llm_response, args=("需求分析",))
+    monitor_thread = threading.Thread(target=monitor_llm_response, args=("需求分析", done_event))
     monitor_thread.daemon = True
     monitor_thread.start()
     
@@ -320,10 +330,11 @@ try:
     try:
         if os.path.exists(requirement_result['output_file']):
             with open(requirement_result['output_file'], 'r', encoding='utf-8') as f:
-                content = f.read()
+                # 只读取摘要所需的前501个字符
+                content = f.read(501)
                 summary = content[:500] + "..." if len(content) > 500 else content
-                logger.info(f"需求分析结果摘要 (使用模型: {active_model_info['provider']} {active_model_info['model_name']}):")
-                print_formatted_text(summary, f"需求分析结果摘要 (由 {active_model_info['provider']} {active_model_info['model_name']} 生成)")
+                logger.info(f"需求分析结果摘要 (使用模型: {PROVIDER_MODEL_STR}):")
+                print_formatted_text(summary, f"需求分析结果摘要 (由 {PROVIDER_MODEL_STR} 生成)")
     except Exception as e:
         logger.error(f"读取结果文件失败: {e}")
     
@@ -334,13 +345,18 @@ except TimeoutError as e:
 except Exception as e:
     logger.error(f"需求分析失败: {e}")
     raise
+finally:
+    # 通知监控线程结束等待
+    done_event.set()
+    monitor_thread.join(timeout=1)
 
 # 模型搜索（针对text2text-generation和text-generation任务爬取相关模型）
 logger.info("开始模型搜索...")
 start_time = time.time()
+done_event = threading.Event()
 try:
     # 创建监控线程
-    monitor_thread = threading.Thread(target=monitor_llm_response, args=("模型搜索",))
+    monitor_thread = threading.Thread(target=monitor_llm_response, args=("模型搜索", done_event))
     monitor_thread.daemon = True
     monitor_thread.start()
     
@@ -348,7 +364,7 @@ try:
     from autoforge.crawler.hf_crawler import HuggingFaceCrawler
     
     # 创建爬虫实例
-    crawler = HuggingFaceCrawler(output_dir=f"{OUTPUT_DIR}/hf_models")
+    crawler = HuggingFaceCrawler(output_dir=f"{OUTPUT_DIR}/hf_models", max_workers=MODEL_DETAIL_WORKERS)
     logger.info("初始化HuggingFace爬虫...")
     
     # 爬取text2text-generation任务的模型(正确任务类型)
@@ -377,31 +393,31 @@ try:
         logger.error(f"爬取text-generation模型失败: {e}")
         text_gen_models = []
     
-    # 爬取模型卡片信息获取更多细节(比如模型大小)
-    if text2text_models:
-        logger.info("获取text2text模型详细信息...")
-        for i, model in enumerate(text2text_models[:TEXT2TEXT_MODEL_DETAIL_COUNT]):  # 获取全部30个模型的详细信息
-            try:
-                model_id = model.get('model_id')
-                if model_id:
-                    logger.info(f"获取模型 {model_id} 的详细信息...")
-                    model_info = crawler.crawl_model_card(model_id)
-                    logger.info(f"获取模型 {model_id} 详细信息成功")
-            except Exception as e:
-                logger.error(f"获取模型详细信息失败: {e}")
+    async def fetch_model_cards(model_ids):
+        """并发获取模型详细信息，所有请求复用爬虫的异步HTTP客户端（同一连接池和TLS会话）"""
+        try:
+            return await crawler.crawl_model_cards_async(model_ids)
+        finally:
+            await crawler.aclose()
     
-    # 同样获取一些text-generation模型的详细信息
-    if text_gen_models:
-        logger.info("获取text-generation模型详细信息...")
-        for i, model in enumerate(text_gen_models[:TEXT_GEN_MODEL_DETAIL_COUNT]):  # 获取前10个详细信息
-            try:
-                model_id = model.get('model_id')
-                if model_id:
-                    logger.info(f"获取模型 {model_id} 的详细信息...")
-                    model_info = crawler.crawl_model_card(model_id)
-                    logger.info(f"获取模型 {model_id} 详细信息成功")
-            except Exception as e:
-                logger.error(f"获取模型详细信息失败: {e}")
+    # 爬取模型卡片信息获取更多细节(比如模型大小)：
+    # text2text模型获取全部30个，text-generation模型获取前10个，合并为一批请求
+    detail_model_ids = list(dict.fromkeys(
+        model['model_id']
+        for model in text2text_models[:TEXT2TEXT_MODEL_DETAIL_COUNT] + text_gen_models[:TEXT_GEN_MODEL_DETAIL_COUNT]
+        if model.get('model_id')
+    ))
+    if detail_model_ids:
+        logger.info(f"获取 {len(detail_model_ids)} 个模型的详细信息...")
+        model_card_results = asyncio.run(fetch_model_cards(detail_model_ids))
+        # 汇总为一条日志，避免逐个模型输出
+        failed_model_ids = [
+            model_id for model_id, result in zip(detail_model_ids, model_card_results)
+            if isinstance(result, Exception)
+        ]
+        logger.info(f"成功获取 {len(detail_model_ids) - len(failed_model_ids)}/{len(detail_model_ids)} 个模型的详细信息")
+        if failed_model_ids:
+            logger.warning(f"获取详细信息失败的模型: {failed_model_ids}")
     
     # 使用超时管理器
     with TimeoutManager(REQUEST_TIMEOUT) as timeout_mgr:
@@ -510,16 +526,20 @@ try:
             logger.info(f"模型 {i+1}: {model.get('model_id', 'Unknown')} (来源: {'text2text-generation' if i < len(text2text_models) else 'text-generation'})")
         
         # 格式化打印爬取的模型信息
-        crawled_models_info = json.dumps(crawled_models[:PRINT_MODEL_COUNT], ensure_ascii=False, indent=2)
+        if orjson is not None:
+            crawled_models_info = orjson.dumps(crawled_models[:PRINT_MODEL_COUNT], option=orjson.OPT_INDENT_2).decode('utf-8')
+        else:
+            crawled_models_info = json.dumps(crawled_models[:PRINT_MODEL_COUNT], ensure_ascii=False, indent=2)
         print_formatted_text(crawled_models_info, f"爬取的前{PRINT_MODEL_COUNT}个模型信息")
     
     # 显示结果摘要
     try:
         if os.path.exists(model_result['output_file']):
             with open(model_result['output_file'], 'r', encoding='utf-8') as f:
-                content = f.read()
+                # 只读取摘要所需的前501个字符
+                content = f.read(501)
                 summary = content[:500] + "..." if len(content) > 500 else content
-                print_formatted_text(summary, f"模型搜索结果摘要 (由 {active_model_info['provider']} {active_model_info['model_name']} 生成)")
+                print_formatted_text(summary, f"模型搜索结果摘要 (由 {PROVIDER_MODEL_STR} 生成)")
     except Exception as e:
         logger.error(f"读取模型搜索结果文件失败: {e}")
         
@@ -529,6 +549,63 @@ except TimeoutError as e:
 except Exception as e:
     logger.error(f"模型搜索失败: {e}")
     raise
+finally:
+    # 通知监控线程结束等待
+    done_event.set()
+    monitor_thread.join(timeout=1)
+
+# 输出子目录说明
+OUTPUT_SUBDIRS = {
+    "requirement_analysis": {
+        "description": "需求分析结果目录",
+        "files": {
+            "requirement_analysis_*.md": "需求分析详细报告，包含任务理解、技术建议等",
+            "raw_document_content.md": "原始需求文档内容"
+        },
+        "usage": "查看这些文件可以了解系统如何理解您的需求，以及提出的初步解决方案建议"
+    },
+    "model_search": {
+        "description": "模型搜索结果目录",
+        "files": {
+            "model_search_*.md": "模型推荐报告，包含推荐模型列表及理由",
+            "candidates.json": "候选模型信息的结构化数据"
+        },
+        "usage": "从这里可以了解系统推荐的适合视频标题规范化的模型，包括每个模型的优缺点分析"
+    },
+    "hf_models": {
+        "description": "HuggingFace模型爬取结果目录",
+        "files": {
+            "*/models_*.json": "按任务分类的模型列表数据",
+            "model_cards/": "爬取的模型卡片详细信息"
+        },
+        "usage": "包含从HuggingFace爬取的最新模型数据，可用于了解模型的详细参数和使用情况"
+    }
+}
+
+# 总体使用建议和后续步骤
+OUTPUT_DIR_GUIDE = (
+    "【使用建议】\n"
+    "1. 首先查看需求分析报告，了解系统对任务的理解\n"
+    "2. 然后查看模型搜索结果，选择最适合的模型\n"
+    "3. 参考HuggingFace模型数据，了解模型的详细参数\n"
+    "4. 根据报告建议，设计您的文本到文本转换实现方案\n\n"
+    "【后续步骤】\n"
+    "1. 实现文本预处理流程，处理输入文本中的噪声\n"
+    "2. 使用推荐模型构建seq2seq转换流程\n"
+    "3. 设计评估方法，确保达到90%以上的准确率\n"
+    "4. 优化推理速度，满足<100ms的延迟要求\n"
+)
+
+# 遍历目录下的文件，最多收集limit个，并返回是否还有更多文件
+def scan_files_limited(dir_path, limit):
+    """递归列出目录中的文件，找到第limit+1个文件时即停止遍历"""
+    files = []
+    for root, _, names in os.walk(dir_path):
+        for name in names:
+            if len(files) == limit:
+                return files, True
+            files.append(Path(root) / name)
+    return files, False
 
 # 解释输出目录结构和文件用途
 def explain_output_directory(dir_path):
@@ -538,92 +615,48 @@ def explain_output_directory(dir_path):
     if not output_path.exists():
         return "输出目录尚未创建"
     
-    explanation = f"\n{'='*80}\n"
-    explanation += f"【{output_path}】目录结构及文件说明\n"
-    explanation += f"{'='*80}\n\n"
-    
-    # 添加使用的模型信息
-    explanation += f"【生成使用的模型信息】\n"
-    explanation += f"- 提供商: {active_model_info['provider']}\n"
-    explanation += f"- 模型名称: {active_model_info['model_name']}\n"
-    explanation += f"- API密钥: {active_model_info['api_key_prefix']}\n\n"
+    parts = [
+        f"\n{SEPARATOR}\n",
+        f"【{output_path}】目录结构及文件说明\n",
+        f"{SEPARATOR}\n\n",
+        # 添加使用的模型信息
+        "【生成使用的模型信息】\n",
+        f"- 提供商: {active_model_info['provider']}\n",
+        f"- 模型名称: {active_model_info['model_name']}\n",
+        f"- API密钥: {active_model_info['api_key_prefix']}\n\n",
+    ]
     
-    # 子目录说明
-    subdirs = {
-        "requirement_analysis": {
-            "description": "需求分析结果目录",
-            "files": {
-                "requirement_analysis_*.md": "需求分析详细报告，包含任务理解、技术建议等",
-                "raw_document_content.md": "原始需求文档内容"
-            },
-            "usage": "查看这些文件可以了解系统如何理解您的需求，以及提出的初步解决方案建议"
-        },
-        "model_search": {
-            "description": "模型搜索结果目录",
-            "files": {
-                "model_search_*.md": "模型推荐报告，包含推荐模型列表及理由",
-                "candidates.json": "候选模型信息的结构化数据"
-            },
-            "usage": "从这里可以了解系统推荐的适合视频标题规范化的模型，包括每个模型的优缺点分析"
-        },
-        "hf_models": {
-            "description": "HuggingFace模型爬取结果目录",
-            "files": {
-                "*/models_*.json": "按任务分类的模型列表数据",
-                "model_cards/": "爬取的模型卡片详细信息"
-            },
-            "usage": "包含从HuggingFace爬取的最新模型数据，可用于了解模型的详细参数和使用情况"
-        }
-    }
-    
-    for subdir_name, info in subdirs.items():
+    for subdir_name, info in OUTPUT_SUBDIRS.items():
         subdir_path = output_path / subdir_name
         if subdir_path.exists():
-            explanation += f"【{subdir_name}】- {info['description']}\n"
+            parts.append(f"【{subdir_name}】- {info['description']}\n")
             
             # 列出实际文件
-            explanation += "  实际文件列表:\n"
-            files = list(subdir_path.glob("**/*"))[:DIR_MAX_FILES_DISPLAY]  # 限制显示前10个文件
+            parts.append("  实际文件列表:\n")
+            files, has_more = scan_files_limited(subdir_path, DIR_MAX_FILES_DISPLAY)  # 限制显示前10个文件
             if files:
-                for file in files:
-                    if file.is_file():
-                        relative_path = file.relative_to(output_path)
-                        explanation += f"  - {relative_path}\n"
-                if len(list(subdir_path.glob("**/*"))) > DIR_MAX_FILES_DISPLAY:
-                    explanation += "  - ... (更多文件)\n"
+                parts.extend(f"  - {file.relative_to(output_path)}\n" for file in files)
+                if has_more:
+                    parts.append("  - ... (更多文件)\n")
             else:
-                explanation += "  - (暂无文件)\n"
+                parts.append("  - (暂无文件)\n")
             
             # 文件说明
-            explanation += "  文件说明:\n"
-            for pattern, desc in info['files'].items():
-                explanation += f"  - {pattern}: {desc}\n"
+            parts.append("  文件说明:\n")
+            parts.extend(f"  - {pattern}: {desc}\n" for pattern, desc in info['files'].items())
             
             # 使用方式
-            explanation += "  使用方式:\n"
-            explanation += f"  - {info['usage']}\n\n"
-    
-    # 总体使用建议
-    explanation += "【使用建议】\n"
-    explanation += "1. 首先查看需求分析报告，了解系统对任务的理解\n"
-    explanation += "2. 然后查看模型搜索结果，选择最适合的模型\n"
-    explanation += "3. 参考HuggingFace模型数据，了解模型的详细参数\n"
-    explanation += "4. 根据报告建议，设计您的文本到文本转换实现方案\n\n"
-    
-    # 后续步骤
-    explanation += "【后续步骤】\n"
-    explanation += "1. 实现文本预处理流程，处理输入文本中的噪声\n"
-    explanation += "2. 使用推荐模型构建seq2seq转换流程\n"
-    explanation += "3. 设计评估方法，确保达到90%以上的准确率\n"
-    explanation += "4. 优化推理速度，满足<100ms的延迟要求\n"
+            parts.append("  使用方式:\n")
+            parts.append(f"  - {info['usage']}\n\n")
     
-    return explanation
+    parts.append(OUTPUT_DIR_GUIDE)
+    return "".join(parts)
 
 # 使用不包含Unicode表情符号的消息
 logger.info("任务完成！")
 print("\n✓ 需求分析完成，结果保存在: {}".format(requirement_result['output_file']))
 print("✓ 模型搜索完成，结果保存在: {}".format(model_result['output_file']))
-print(f"✓ 使用的模型: {active_model_info['provider']} {active_model_info['model_name']}")
+print(f"✓ 使用的模型: {PROVIDER_MODEL_STR}")
 
 # 输出目录结构说明
 directory_explanation = explain_output_directory(OUTPUT_DIR)
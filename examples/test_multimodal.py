@@ -8,20 +8,26 @@ import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+EXAMPLES_DIR = Path(__file__).resolve().parent
+ROOT_DIR = EXAMPLES_DIR.parent
+
 # 自动加载同级目录下的.env文件
-load_dotenv(dotenv_path=Path(__file__).parent / '.env')
+load_dotenv(dotenv_path=EXAMPLES_DIR / '.env')
 
-# 添加项目根目录到Python路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# 添加项目根目录到Python路径（避免重复添加）
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
 
+from autoforge import configure_third_party_logging
 from autoforge.llm import BaiLianClient
 from autoforge.docparser import MultiModalDocParser
 
 # 配置日志
 from loguru import logger
-import logging
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
+configure_third_party_logging()
+
+# 支持的测试图片格式
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff'}
 
 
 def test_image_analysis():
@@ -57,8 +63,12 @@ def test_image_analysis():
         print("请在该目录下放置一些测试图片（jpg/png格式）")
         return
     
-    # 查找测试图片
-    image_files = list(test_image_dir.glob("*.jpg")) + list(test_image_dir.glob("*.png"))
+    # 查找测试图片（单次遍历目录）
+    with os.scandir(test_image_dir) as entries:
+        image_files = sorted(
+            Path(entry.path) for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_SUFFIXES
+        )
     
     if not image_files:
         print(f"📁 在 {test_image_dir} 目录下没有找到测试图片")
@@ -91,11 +101,12 @@ def test_image_analysis():
         print(f"\n📸 测试2: 批量图片分析（共{len(image_files)}张图片）")
         
         try:
-            # 最多分析3张图片
+            # 最多分析3张图片，并发请求
             batch_images = [str(img) for img in image_files[:3]]
             results = llm_client.analyze_images_batch(
                 image_paths=batch_images,
                 prompt="请简要描述这张图片的主要内容",
+                max_workers=len(batch_images),
                 temperature=0.3
             )
             
@@ -148,6 +159,11 @@ def create_sample_images():
     sample_dir = Path("examples/test_images")
     sample_dir.mkdir(parents=True, exist_ok=True)
     
+    readme_path = sample_dir / "README.md"
+    if readme_path.exists():
+        # 说明文件已存在，无需重复写入
+        return
+    
     readme_content = """# 测试图片目录
 
 请在此目录下放置一些测试图片，支持的格式：
@@ -170,7 +186,6 @@ def create_sample_images():
 - photo.jpg
 """
     
-    readme_path = sample_dir / "README.md"
     with open(readme_path, 'w', encoding='utf-8') as f:
         f.write(readme_content)
     
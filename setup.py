@@ -36,6 +36,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=4.0.0",
         ],
@@ -0,0 +1,50 @@
+"""
+测试共用的fixture
+
+运行方式: pytest -n auto --durations=10 tests/  （-n 需要安装pytest-xdist）
+"""
+
+import os
+import sys
+import logging
+import logging.handlers
+
+import pytest
+
+from autoforge.crawler import TaskManager, HuggingFaceCrawler
+from autoforge.analyzers import ModelSearcher
+
+OUTPUT_DIR = "outputs/test_crawler"
+
+# 测试输出统一走日志：缓冲64条后批量写入stdout，CI可设置 AUTOFORGE_TEST_LOG=WARNING 静默
+_stream_handler = logging.StreamHandler(stream=sys.stdout)
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+LOG_HANDLER = logging.handlers.MemoryHandler(capacity=64, target=_stream_handler)
+logging.getLogger("autoforge").setLevel(os.environ.get("AUTOFORGE_TEST_LOG", "INFO").upper())
+logging.getLogger("autoforge.tests").addHandler(LOG_HANDLER)
+
+
+@pytest.fixture(autouse=True)
+def flush_test_log():
+    """每个测试结束时输出缓冲的日志"""
+    yield
+    LOG_HANDLER.flush()
+
+
+# 被测对象在每个测试进程内只创建一次，供所有测试复用
+@pytest.fixture(scope="session")
+def task_manager():
+    """共享的任务管理器"""
+    return TaskManager()
+
+
+@pytest.fixture(scope="session")
+def crawler():
+    """共享的HuggingFace爬虫"""
+    return HuggingFaceCrawler(output_dir=OUTPUT_DIR)
+
+
+@pytest.fixture(scope="session")
+def model_searcher(crawler):
+    """共享的不使用LLM的模型搜索器，与爬虫测试共用同一个爬虫"""
+    return ModelSearcher(use_crawler=True, output_dir=OUTPUT_DIR, crawler=crawler)
@@ -0,0 +1,73 @@
+"""
+SQLiteCache 与下载清单测试
+"""
+
+import os
+
+from autoforge.crawler import SQLiteCache
+from autoforge.crawler._cache import DownloadManifest
+from autoforge.crawler.paper_downloader import PaperDownloader
+
+
+def test_sqlite_cache_roundtrip(tmp_path):
+    """写入的值可以读回，未写入的键未命中"""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+    cache.set("key", {"title": "论文", "tasks": ["nlp"]})
+    
+    assert cache.get("key") == {"title": "论文", "tasks": ["nlp"]}
+    assert cache.get("missing") is None
+    cache.close()
+
+
+def test_sqlite_cache_ttl(tmp_path):
+    """超过有效期的记录按未命中处理"""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    cache.set("fresh", 1)
+    cache.set("stale", 2)
+    cache._conn.execute("UPDATE responses SET ts = ts - 120 WHERE url = 'stale'")
+    
+    assert cache.get("fresh") == 1
+    assert cache.get("stale") is None
+    cache.close()
+
+
+def test_sqlite_cache_errors_are_misses(tmp_path):
+    """数据库读取失败或值无法序列化时不抛出异常"""
+    cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+    cache.set("unserializable", {"value": object()})
+    assert cache.get("unserializable") is None
+    
+    cache.set("key", 1)
+    cache._conn.execute("DROP TABLE responses")
+    assert cache.get("key") is None
+    cache.close()
+
+
+def test_manifest_lookup(tmp_path):
+    """按论文标识和内容哈希查找文件，文件已删除时未命中"""
+    manifest = DownloadManifest(str(tmp_path / ".manifest.db"))
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF")
+    manifest.record("1706.03762", "abc", str(pdf))
+    
+    assert manifest.path_for_id("1706.03762") == pdf
+    assert manifest.path_for_hash("abc") == pdf
+    assert manifest.path_for_id("missing") is None
+    
+    pdf.unlink()
+    assert manifest.path_for_id("1706.03762") is None
+    assert manifest.path_for_hash("abc") is None
+    manifest.close()
+
+
+def test_duplicate_downloads_are_hard_linked(tmp_path):
+    """内容相同的下载以硬链接共享同一份文件"""
+    with PaperDownloader(output_dir=str(tmp_path)) as downloader:
+        for name in ("a", "b"):
+            part = tmp_path / f"{name}.pdf.part"
+            part.write_bytes(b"%PDF same content")
+            downloader._commit_download(name, part, tmp_path / f"{name}.pdf", "digest")
+        
+        assert os.stat(tmp_path / "a.pdf").st_ino == os.stat(tmp_path / "b.pdf").st_ino
+        assert not list(tmp_path.glob("*.part"))
+        assert downloader.manifest.path_for_id("b") == tmp_path / "b.pdf"
@@ -0,0 +1,58 @@
+"""
+OpenAIClient.generate_multi 批量请求测试
+"""
+
+import json
+
+from autoforge.llm import OpenAIClient
+
+
+def create_client(responses):
+    """创建按顺序返回预设响应的客户端，并记录每次请求的消息"""
+    client = OpenAIClient(api_key="test")
+    client._encoding = None  # 使用按字符数估算token，结果与是否安装tiktoken无关
+    client.requests = []
+    
+    def generate_with_messages(messages, temperature, max_tokens, **kwargs):
+        client.requests.append(messages)
+        return responses[len(client.requests) - 1]
+    
+    client.generate_with_messages = generate_with_messages
+    return client
+
+
+def test_split_multi_batches():
+    """超出token预算时拆分为多个批次，编号在批次间连续"""
+    client = create_client([])
+    prompts = ["a" * 40, "b" * 40, "c" * 40]
+    
+    batches = client._split_multi_batches(prompts, "sys", max_input_tokens=50)
+    
+    assert batches == [[(1, prompts[0]), (2, prompts[1])], [(3, prompts[2])]]
+    assert client._split_multi_batches(prompts, "sys", max_input_tokens=1000) == [list(enumerate(prompts, 1))]
+
+
+def test_generate_multi_maps_results_by_id():
+    """结果按编号映射回条目顺序，跨批次合并"""
+    client = create_client([
+        json.dumps({"items": [{"id": 2, "result": "B"}, {"id": "1", "result": "A"}]}),
+        json.dumps({"items": [{"id": 3, "result": "C"}]}),
+    ])
+    
+    results = client.generate_multi(["a" * 40, "b" * 40, "c" * 40], "sys", max_input_tokens=50)
+    
+    assert results == ["A", "B", "C"]
+    assert len(client.requests) == 2
+    assert client.requests[1][1]["content"].startswith("Process items:\n3. ")
+
+
+def test_generate_multi_skips_invalid_ids():
+    """无法解析或超出范围的编号被忽略，缺失的条目和空响应对应None"""
+    client = create_client([
+        json.dumps({"items": [{"id": "1a", "result": "x"}, {"id": 9, "result": "y"}, {"id": 2, "result": "B"}]}),
+        None,
+    ])
+    
+    results = client.generate_multi(["a" * 40, "b" * 40, "c" * 40], "sys", max_input_tokens=50)
+    
+    assert results == [None, "B", None]
@@ -7,13 +7,12 @@ import sys
 import logging
 from pathlib import Path
 
+import requests
+
 # 添加项目根目录到路径
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from autoforge.crawler import PapersWithCodeCrawler
-from autoforge.crawler.paper_downloader import PaperDownloader
-from autoforge.analyzers.paper_analyzer import PaperAnalyzer
-from autoforge.llm import BaiLianClient
+from autoforge.crawler import PapersWithCodeCrawler, SQLiteCache, RateLimiter
 
 # 配置日志
 logging.basicConfig(
@@ -23,6 +22,15 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# 所有组件共用一个HTTP会话，复用keep-alive连接，避免每个请求重复TCP/TLS握手
+SESSION = requests.Session()
+
+# 所有组件共享各主机的请求额度：任意时间窗口内的请求数不超过站点的承受范围
+RATE_LIMITER = RateLimiter({
+    'paperswithcode.com': (4, 1.0),
+    'arxiv.org': (4, 1.0),
+})
+
 
 def test_basic_functionality():
     """测试基本功能"""
@@ -38,6 +46,10 @@ def test_basic_functionality():
         llm_client = None
     else:
         try:
+            # 仅在需要时导入LLM客户端
+            from autoforge.llm import BaiLianClient
+            
+            # 不启用响应缓存，每次运行都实际调用API以检查密钥和服务可用性
             llm_client = BaiLianClient(api_key=api_key, model=model)
             logger.info("✓ LLM客户端初始化成功")
         except Exception as e:
@@ -55,10 +67,22 @@ def test_basic_functionality():
     
     # 3. 测试组件初始化
     try:
-        pwc_crawler = PapersWithCodeCrawler(output_dir=str(output_dir / "pwc_results"))
+        from autoforge.crawler.paper_downloader import PaperDownloader
+        from autoforge.analyzers.paper_analyzer import PaperAnalyzer
+        
+        pwc_crawler = PapersWithCodeCrawler(
+            output_dir=str(output_dir / "pwc_results"),
+            session=SESSION,
+            rate_limiter=RATE_LIMITER,
+            cache=SQLiteCache(ttl=86400)  # 重复运行时直接复用一天内的搜索结果
+        )
         logger.info("✓ PapersWithCodeCrawler 初始化成功")
         
-        paper_downloader = PaperDownloader(output_dir=str(output_dir / "papers"))
+        paper_downloader = PaperDownloader(
+            output_dir=str(output_dir / "papers"),
+            session=SESSION,
+            rate_limiter=RATE_LIMITER
+        )
         logger.info("✓ PaperDownloader 初始化成功")
         
         paper_analyzer = PaperAnalyzer(llm_client=llm_client, output_dir=str(output_dir))
@@ -76,21 +100,25 @@ def test_basic_functionality():
         "deep learning"        # 通用术语
     ]
     
+    # 所有搜索词合并为一次请求，按搜索词顺序取第一个有结果的，确定后不再等待其余搜索
+    logger.info(f"测试搜索词: {search_terms}")
+    try:
+        results = pwc_crawler.search_papers_batch(search_terms, top_k=3, stop_on_first=True)
+    except Exception as e:
+        logger.error(f"✗ 批量搜索失败: {e}")
+        results = {}
+    
     search_success = False
     for search_term in search_terms:
-        try:
-            logger.info(f"测试搜索词: '{search_term}'")
-            papers = pwc_crawler.search_papers(search_term, top_k=3)
-            if papers:
-                logger.info(f"✓ 搜索 '{search_term}' 成功，找到 {len(papers)} 篇论文")
-                for i, paper in enumerate(papers):
-                    logger.info(f"  论文 {i+1}: {paper.get('title', '未知标题')}")
-                search_success = True
-                break
-            else:
-                logger.warning(f"! 搜索 '{search_term}' 未返回结果")
-        except Exception as e:
-            logger.error(f"✗ 搜索 '{search_term}' 失败: {e}")
+        papers = results.get(search_term)
+        if papers:
+            logger.info(f"✓ 搜索 '{search_term}' 成功，找到 {len(papers)} 篇论文")
+            for i, paper in enumerate(papers):
+                logger.info(f"  论文 {i+1}: {paper.get('title', '未知标题')}")
+            search_success = True
+            break
+        else:
+            logger.warning(f"! 搜索 '{search_term}' 未返回结果")
     
     if not search_success:
         logger.warning("! 所有搜索词都未返回结果，可能是网站结构变化")
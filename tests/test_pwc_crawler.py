@@ -0,0 +1,98 @@
+"""
+PapersWithCodeCrawler 批量搜索与重试退避测试（不访问网络）
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from autoforge.crawler import PapersWithCodeCrawler
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    """search_papers被替换为按查询返回预设结果的桩函数，并记录每次查询"""
+    crawler = PapersWithCodeCrawler(output_dir=str(tmp_path))
+    crawler.queries = []
+    crawler.responses = {}
+    
+    def search_papers(query, top_k=10):
+        crawler.queries.append(query)
+        response = crawler.responses.get(query, [])
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    crawler.search_papers = search_papers
+    yield crawler
+    crawler.close()
+
+
+def paper(title, tasks=()):
+    return {'title': title, 'tasks': list(tasks)}
+
+
+def test_batch_splits_or_query_results_by_term(crawler):
+    """多个词合并为一次OR查询，结果按标题或任务包含词的全部词元归入各词"""
+    crawler.responses["bert model OR graph"] = [
+        paper("BERT: Pre-training of Deep Bidirectional Transformers", ["Language Model"]),
+        paper("Graph Attention Networks"),
+    ]
+    
+    results = crawler.search_papers_batch(["bert model", "graph"], top_k=5)
+    
+    assert crawler.queries == ["bert model OR graph"]
+    assert [p['title'] for p in results["bert model"]] == ["BERT: Pre-training of Deep Bidirectional Transformers"]
+    assert [p['title'] for p in results["graph"]] == ["Graph Attention Networks"]
+
+
+def test_batch_falls_back_to_single_searches(crawler):
+    """未分到结果的词单独搜索，单独搜索失败的词返回空列表"""
+    crawler.responses["graph OR vision OR speech"] = [paper("Graph Attention Networks")]
+    crawler.responses["vision"] = [paper("An Image is Worth 16x16 Words")]
+    crawler.responses["speech"] = RuntimeError("boom")
+    
+    results = crawler.search_papers_batch(["graph", "vision", "speech", "graph"], top_k=5)
+    
+    assert list(results) == ["graph", "vision", "speech"]
+    assert [p['title'] for p in results["vision"]] == ["An Image is Worth 16x16 Words"]
+    assert results["speech"] == []
+    assert sorted(crawler.queries[1:]) == ["speech", "vision"]
+
+
+def test_batch_chunks_by_search_batch_size(crawler):
+    """超过SEARCH_BATCH_SIZE的词分多次合并查询"""
+    crawler.SEARCH_BATCH_SIZE = 2
+    
+    crawler.search_papers_batch(["a", "b", "c"])
+    
+    assert crawler.queries[0] == "a OR b"
+    assert "c" in crawler.queries
+    assert not any("c" in query and "OR" in query for query in crawler.queries)
+
+
+def test_batch_stop_on_first(crawler):
+    """stop_on_first时确定第一个有结果的词后，排在其后的词不再搜索"""
+    crawler.responses["alpha OR beta OR gamma"] = [paper("Beta Networks")]
+    
+    results = crawler.search_papers_batch(["alpha", "beta", "gamma"], stop_on_first=True)
+    
+    assert list(results) == ["alpha", "beta"]
+    assert results["alpha"] == []
+    assert "gamma" not in crawler.queries
+
+
+def test_backoff_delay_honours_retry_after(crawler):
+    """Retry-After为秒数或HTTP日期时按其等待，否则使用带抖动的指数退避"""
+    assert crawler._backoff_delay(1, "5") == 5.0
+    assert crawler._backoff_delay(1, "-3") == 0.0
+    
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < crawler._backoff_delay(1, retry_at) <= 30
+    
+    crawler.delay = 1.0
+    for retry_after in (None, "not a date"):
+        delay = crawler._backoff_delay(2, retry_after)
+        assert 2.0 <= delay <= 6.0
+    assert crawler._backoff_delay(20) <= crawler.MAX_BACKOFF * 1.5
@@ -0,0 +1,33 @@
+"""
+RateLimiter 限流测试
+"""
+
+from autoforge.crawler import RateLimiter
+
+
+def test_subdomains_share_budget():
+    """同一域名的各子域名共用一份请求额度"""
+    limiter = RateLimiter({'arxiv.org': (1, 10.0)})
+    
+    assert limiter._reserve("https://arxiv.org/abs/1706.03762") == 0.0
+    assert limiter._reserve("https://export.arxiv.org/api/query") > 9.0
+    assert limiter._reserve("https://www.arxiv.org/pdf/1706.03762") > 19.0
+
+
+def test_unlisted_hosts_counted_separately():
+    """未列出的主机各自使用默认限制，未设置默认限制时不限流"""
+    limiter = RateLimiter({'arxiv.org': (1, 10.0)}, default=(1, 10.0))
+    
+    assert limiter._reserve("https://a.example.com/") == 0.0
+    assert limiter._reserve("https://b.example.com/") == 0.0
+    assert limiter._reserve("https://a.example.com/") > 9.0
+    
+    assert RateLimiter({'arxiv.org': (1, 10.0)})._reserve("https://example.com/") == 0.0
+
+
+def test_single_label_host():
+    """单标签主机名（如localhost、内网主机）也能匹配限制"""
+    limiter = RateLimiter({'localhost': (1, 10.0)})
+    
+    assert limiter._reserve("http://localhost:8000/a") == 0.0
+    assert limiter._reserve("http://localhost:8000/b") > 9.0